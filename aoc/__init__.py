@@ -0,0 +1,5 @@
+"""
+Tooling shared by the daily solutions in the day??/solve.py scripts.
+
+Run `python3 -m aoc --help` for the available commands.
+"""
@@ -0,0 +1,251 @@
+"""
+Command-line entry point, see `python3 -m aoc --help`.
+
+The modules behind each command are only imported when that command
+runs, so that starting up stays cheap.
+"""
+
+import argparse
+import sys
+
+from aoc import days
+
+# where the server listens, kept here so as not to import it needlessly
+SOCKET_NAME = '.cache/solve.sock'
+SOCKET = days.ROOT / SOCKET_NAME
+
+
+def day_list(arg):
+    try:
+        return days.parse_days([arg])
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def add_selection(parser):
+    parser.add_argument(
+        'days', nargs='*', type=day_list, metavar='DAY',
+        help='a day or range of days such as 3-5 '
+             '(default: every day with an input.txt)',
+    )
+    parser.add_argument(
+        '-p', '--part', type=int, choices=days.PARTS, action='append',
+        help='only this part (may be repeated; default: both parts)',
+    )
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(prog='python3 -m aoc')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser(
+        'run', help='solve puzzles and write the day??/output?.txt files')
+    add_selection(run)
+    modes = run.add_mutually_exclusive_group()
+    modes.add_argument(
+        '-j', '--jobs', type=int, nargs='?', const=0, metavar='N',
+        help='solve in parallel on N worker processes '
+             '(default without N: one per CPU)',
+    )
+    modes.add_argument(
+        '--phases', action='store_true',
+        help='report the time and peak memory of each phase, '
+             'such as parsing, bypassing the cache',
+    )
+    modes.add_argument(
+        '--phases-json', metavar='FILE',
+        help='like --phases, and also write the report to FILE as JSON',
+    )
+    modes.add_argument(
+        '--memory', action='store_true',
+        help='report the peak memory of each part and the lines which '
+             'allocated most of it, recording them in stats.json',
+    )
+    run.add_argument(
+        '--timeout', type=float, metavar='SECONDS',
+        help='interrupt any part that runs for longer than this',
+    )
+    run.add_argument(
+        '--no-cache', action='store_true',
+        help='neither use nor store answers in .cache/results/',
+    )
+    run.add_argument(
+        '--snapshots', action='store_true',
+        help='reuse parsed inputs across parts and runs, pickled '
+             'into day??/parsed-*.pickle',
+    )
+
+    bench = commands.add_parser(
+        'bench', help='time the solutions on synthetic inputs')
+    add_selection(bench)
+    bench.add_argument(
+        '--steps', type=int, default=4, metavar='N',
+        help='number of sizes to try, doubling each time (default: 4)',
+    )
+    bench.add_argument(
+        '--scale', type=float, default=1, metavar='F',
+        help='multiply the smallest size by this factor (default: 1)',
+    )
+    bench.add_argument(
+        '--repeat', type=int, default=3, metavar='N',
+        help='take the median of this many runs (default: 3)',
+    )
+    bench.add_argument(
+        '--budget', type=float, default=10, metavar='SECONDS',
+        help='give up on the larger sizes of a part once a run takes '
+             'longer than this (default: 10)',
+    )
+
+    compare = commands.add_parser(
+        'compare', help='compare the latest benchmark results against '
+                        'a baseline, failing if any of them regressed')
+    add_selection(compare)
+    compare.add_argument(
+        '--threshold', type=float, default=0.2, metavar='F',
+        help='how much slower a median may get, as a fraction '
+             '(default: 0.2)',
+    )
+    compare.add_argument(
+        '--update', action='store_true',
+        help='then make the latest results the new baseline',
+    )
+
+    serve = commands.add_parser(
+        'serve', help='keep the solutions loaded, solving the inputs sent '
+                      'to a Unix socket')
+    serve.add_argument(
+        '--socket', default=SOCKET, metavar='PATH',
+        help=f'listen on this socket (default: {SOCKET_NAME})',
+    )
+    serve.add_argument(
+        '-j', '--jobs', dest='workers', type=int, metavar='N',
+        help='solve the slow parts on N worker processes '
+             '(default: one per CPU)',
+    )
+
+    submit = commands.add_parser(
+        'submit', help='solve puzzles through a running server')
+    add_selection(submit)
+    submit.add_argument(
+        '--socket', default=SOCKET, metavar='PATH',
+        help=f'connect to this socket (default: {SOCKET_NAME})',
+    )
+    submit.add_argument(
+        '--timeout', type=float, metavar='SECONDS',
+        help='interrupt any part that runs for longer than this',
+    )
+    submit.add_argument(
+        '--stats', action='store_true',
+        help='instead, show how many requests are pending and the '
+             'latency of the latest ones',
+    )
+
+    profile = commands.add_parser(
+        'profile', help='sample the call stacks of one part, for a flame '
+                        'graph and a table of the hottest functions')
+    profile.add_argument('day', type=int, choices=days.DAYS, metavar='DAY')
+    profile.add_argument('part', type=int, choices=days.PARTS,
+                         metavar='PART')
+    profile.add_argument(
+        '--size', type=int, metavar='N',
+        help='profile a synthetic input of size N, as for the bench '
+             'command, instead of input.txt',
+    )
+    profile.add_argument(
+        '--seed', type=int, default=0,
+        help='seed for the synthetic input (default: 0)',
+    )
+    profile.add_argument(
+        '--interval', type=float, default=0.001, metavar='SECONDS',
+        help='time between samples (default: 0.001)',
+    )
+    profile.add_argument(
+        '--top', type=int, default=20, metavar='N',
+        help='list the N hottest functions (default: 20)',
+    )
+    profile.add_argument(
+        '-o', '--output', metavar='FILE',
+        help='where to write the collapsed stacks '
+             '(default: .cache/profiles/DAY.PART.folded)',
+    )
+
+    imports = commands.add_parser(
+        'imports', help='time how long a fresh process takes to import '
+                        'each solution, and the modules it imports')
+    imports.add_argument(
+        'days', nargs='*', type=day_list, metavar='DAY',
+        help='a day or range of days such as 3-5 (default: every day)',
+    )
+    imports.add_argument(
+        '--budget', type=float, metavar='MS',
+        help='fail if any solution takes longer than this to import',
+    )
+    imports.add_argument(
+        '--repeat', type=int, default=3, metavar='N',
+        help='import each solution N times, keeping the fastest '
+             '(default: 3)',
+    )
+    imports.add_argument(
+        '--top', type=int, default=10, metavar='N',
+        help='list the N modules slowest to import (default: 10)',
+    )
+
+    fetch = commands.add_parser(
+        'fetch', help='download the puzzle inputs into day??/input.txt')
+    fetch.add_argument(
+        'days', nargs='*', type=day_list, metavar='DAY',
+        help='a day or range of days such as 3-5 (default: every day)',
+    )
+    fetch.add_argument(
+        '--url', default='https://adventofcode.com/2022',
+        help='where to download from (default: %(default)s)',
+    )
+    fetch.add_argument(
+        '--session', metavar='FILE',
+        help='the session cookie, in any format that curl --cookie '
+             'accepts (default: session.txt)',
+    )
+    fetch.add_argument(
+        '-j', '--jobs', dest='workers', type=int, default=4, metavar='N',
+        help='download over N connections at once (default: 4)',
+    )
+    fetch.add_argument(
+        '--force', action='store_true',
+        help='download the inputs again even if they are present',
+    )
+
+    args = parser.parse_args(args)
+    if hasattr(args, 'days'):
+        args.days = sorted({day for group in args.days for day in group})
+    return args
+
+
+def main(args):
+    args = parse_args(args)
+    if args.command == 'run':
+        from aoc import runner
+        return runner.main(args)
+    elif args.command == 'bench':
+        from aoc.bench import harness
+        return harness.main(args)
+    elif args.command == 'compare':
+        from aoc.bench import history
+        return history.main(args)
+    elif args.command == 'profile':
+        from aoc import sampler
+        return sampler.main(args)
+    elif args.command == 'imports':
+        from aoc import imports
+        return imports.main(args)
+    elif args.command == 'fetch':
+        from aoc import fetch
+        return fetch.main(args)
+    elif args.command in ('serve', 'submit'):
+        from aoc import server
+        return server.main(args)
+    else:
+        raise ValueError(f'invalid command: {args.command!r}')
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,6 @@
+"""
+Benchmarks of the daily solutions on synthetic inputs of growing size.
+
+The generate module makes valid puzzle inputs at any size, and the
+harness module times the solutions across a ladder of sizes.
+"""
@@ -0,0 +1,468 @@
+"""
+Generators of synthetic puzzle inputs, one per day.
+
+Each generator takes a size n and a random.Random instance, and returns
+an input of roughly n "things" (elves, rounds, trees per side, sensors,
+monkeys...) which the corresponding solution accepts.
+
+>>> print(generate(1, 3, seed=1), end='')
+38303
+56537
+<BLANKLINE>
+17716
+<BLANKLINE>
+33468
+>>> from aoc import days
+>>> all(
+...     days.solve(day, 1, generate(day, BASE[day], seed=day)) is not None
+...     for day in GENERATORS
+... )
+True
+"""
+
+import json
+import random
+import string
+
+# sizes at which each solution takes a few milliseconds at most
+BASE = {
+    1: 1000, 2: 1000, 3: 300, 4: 1000, 5: 1000,
+    6: 10_000, 7: 100, 8: 20, 9: 200, 10: 1000,
+    11: 4, 12: 20, 13: 50, 14: 10, 15: 20,
+    16: 8, 17: 50, 18: 200, 19: 1, 20: 200,
+    21: 101, 22: 100, 23: 10, 24: 8, 25: 200,
+}
+
+# the largest sizes worth trying for the solutions whose running time
+# grows exponentially: day 16 takes well over a minute on 64 valves
+LIMIT = {
+    16: 32,
+}
+
+# how many rocks to drop on generated day 17 jets, and how deep the
+# surface of the tower may be after that for the jets to be kept
+SETTLE = 1000
+SURFACE = 100
+
+# parts which the generated inputs can't exercise
+SKIP = {
+    (15, 2),  # we can't cheaply place sensors to leave exactly one gap
+    (25, 2),  # there is no part 2
+}
+
+
+def day01(n, rng):
+    # n elves carrying a few items each
+    return '\n\n'.join(
+        '\n'.join(
+            str(rng.randrange(1000, 60_000))
+            for _ in range(rng.randrange(1, 6))
+        )
+        for _ in range(n)
+    ) + '\n'
+
+
+def day02(n, rng):
+    # n rounds
+    return ''.join(
+        f'{rng.choice("ABC")} {rng.choice("XYZ")}\n'
+        for _ in range(n)
+    )
+
+
+def day03(n, rng):
+    # n rucksacks, in groups of three sharing exactly one badge
+    lines = []
+    for _ in range(-(-n // 3)):
+        letters = list(string.ascii_letters)
+        rng.shuffle(letters)
+        badge, shared = letters[0], letters[1:4]
+        pools = [letters[4:20], letters[20:36], letters[36:52]]
+        for s, pool in zip(shared, pools):
+            size = rng.randrange(4, 16)
+            left = [s, badge] + rng.choices(pool[:8], k=size-2)
+            right = [s] + rng.choices(pool[8:], k=size-1)
+            rng.shuffle(left)
+            rng.shuffle(right)
+            lines.append(''.join(left + right))
+    return '\n'.join(lines) + '\n'
+
+
+def day04(n, rng):
+    # n pairs of section assignments
+    lines = []
+    for _ in range(n):
+        a, b = sorted(rng.choices(range(1, 100), k=2))
+        c, d = sorted(rng.choices(range(1, 100), k=2))
+        lines.append(f'{a}-{b},{c}-{d}\n')
+    return ''.join(lines)
+
+
+def day05(n, rng):
+    # n moves between 9 stacks, which never empty out
+    heights = [rng.randrange(1, n // 5 + 2) for _ in range(9)]
+    heights[0] += 1  # so that some stack can always give away a crate
+    lines = []
+    for row in reversed(range(max(heights))):
+        lines.append(' '.join(
+            f'[{rng.choice(string.ascii_uppercase)}]' if h > row else '   '
+            for h in heights
+        ))
+    lines.append(' ' + '   '.join('123456789') + ' ')
+    lines.append('')
+    for _ in range(n):
+        source = rng.choice([i for i, h in enumerate(heights) if h > 1])
+        destination = rng.choice([i for i in range(9) if i != source])
+        quantity = rng.randrange(1, min(heights[source], 50))
+        heights[source] -= quantity
+        heights[destination] += quantity
+        lines.append(f'move {quantity} from {source+1} to {destination+1}')
+    return '\n'.join(lines) + '\n'
+
+
+def day06(n, rng):
+    # n characters, with the first markers right at the end
+    return ''.join(rng.choices('abc', k=n)) + 'defghijklmnopqr' + 'x'
+
+
+def day07(n, rng):
+    # a terminal session exploring n directories
+    children = [[] for _ in range(n)]
+    for d in range(1, n):
+        children[rng.randrange(d)].append(d)
+    lines = ['$ cd /']
+    stack = [0]
+    while stack:
+        d = stack.pop()
+        if d is None:
+            lines.append('$ cd ..')
+            continue
+        if d:
+            lines.append(f'$ cd d{d}')
+        lines.append('$ ls')
+        lines.extend(f'dir d{c}' for c in children[d])
+        lines.extend(
+            f'{rng.randrange(1, 300_000)} f{f}.txt'
+            for f in range(rng.randrange(5))
+        )
+        for c in reversed(children[d]):
+            stack.extend([None, c])
+    return '\n'.join(lines) + '\n'
+
+
+def day08(n, rng):
+    # a grid of n by n trees
+    return ''.join(
+        ''.join(rng.choices('0123456789', k=n)) + '\n'
+        for _ in range(n)
+    )
+
+
+def day09(n, rng):
+    # n moves of the head
+    return ''.join(
+        f'{rng.choice("UDLR")} {rng.randrange(1, 20)}\n'
+        for _ in range(n)
+    )
+
+
+def day10(n, rng):
+    # n instructions
+    return ''.join(
+        'noop\n' if rng.random() < 0.3 else f'addx {rng.randrange(-20, 21)}\n'
+        for _ in range(n)
+    )
+
+
+def day11(n, rng):
+    # n monkeys; worry levels stay bounded since nobody squares them
+    primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
+    n = max(n, 2)
+    monkeys = []
+    for m in range(n):
+        items = ', '.join(
+            str(rng.randrange(50, 100))
+            for _ in range(rng.randrange(1, 6))
+        )
+        if rng.random() < 0.5:
+            op = f'+ {rng.randrange(1, 9)}'
+        else:
+            op = f'* {rng.randrange(2, 4)}'
+        others = [o for o in range(n) if o != m]
+        monkeys.append(
+            f'Monkey {m}:\n'
+            f'  Starting items: {items}\n'
+            f'  Operation: new = old {op}\n'
+            f'  Test: divisible by {rng.choice(primes)}\n'
+            f'    If true: throw to monkey {rng.choice(others)}\n'
+            f'    If false: throw to monkey {rng.choice(others)}\n'
+        )
+    return '\n'.join(monkeys)
+
+
+def day12(n, rng):
+    # an n by n heightmap, climbable along the top and right edges
+    n = max(n, 14)
+    rows = []
+    for x in range(n):
+        row = []
+        for y in range(n):
+            if x == 0 or y == n-1:
+                row.append(string.ascii_lowercase[(x + y) * 25 // (2*n - 2)])
+            else:
+                row.append(rng.choice(string.ascii_lowercase))
+        rows.append(row)
+    rows[0][0] = 'S'
+    rows[n-1][n-1] = 'E'
+    return ''.join(''.join(row) + '\n' for row in rows)
+
+
+def random_packet(rng, depth):
+    if depth == 0 or rng.random() < 0.3:
+        return rng.randrange(11)
+    return [random_packet(rng, depth-1) for _ in range(rng.randrange(4))]
+
+
+def day13(n, rng):
+    # n pairs of packets, all different thanks to a unique first item
+    ids = rng.sample(range(10, 10 + 4*n), 2*n)
+    packets = [
+        json.dumps([i, random_packet(rng, 3)], separators=(',', ':'))
+        for i in ids
+    ]
+    return '\n'.join(
+        f'{left}\n{right}\n'
+        for left, right in zip(packets[::2], packets[1::2])
+    )
+
+
+def segment(start, end):
+    # the points of a horizontal or vertical segment, both ends included
+    (x0, y0), (x1, y1) = start, end
+    dx, dy = (x1 > x0) - (x1 < x0), (y1 > y0) - (y1 < y0)
+    steps = max(abs(x1 - x0), abs(y1 - y0))
+    return [(x0 + i * dx, y0 + i * dy) for i in range(steps + 1)]
+
+
+def day14(n, rng):
+    # n rock paths, which stay clear of a diagonal from the source and of
+    # the column below its end, so that the sand can always fall down it
+    # into the abyss in part 1 rather than piling up to the source
+    depth = 10 + n // 2
+    width = min(depth, 400)
+    side = rng.choice([-1, 1])
+    reach = max(2, depth // 3)
+    clear = {(500 + side * i, i) for i in range(reach + 1)}
+    column = 500 + side * reach
+    lines = []
+    while len(lines) < n:
+        x = rng.randrange(500 - width, 500 + width)
+        y = rng.randrange(1, depth)
+        points = [(x, y)]
+        for i in range(rng.randrange(1, 5)):
+            delta = rng.randrange(1, 10)
+            if i % 2 == 0:
+                x += rng.choice([-delta, delta])
+            else:
+                y += delta if y <= delta or rng.random() < 0.5 else -delta
+            points.append((x, y))
+        if any(
+            point in clear or (point[0] == column and point[1] >= reach)
+            for start, end in zip(points, points[1:])
+            for point in segment(start, end)
+        ):
+            continue
+        lines.append(' -> '.join(f'{x},{y}' for x, y in points))
+    return '\n'.join(lines) + '\n'
+
+
+def day15(n, rng):
+    # n sensors
+    lines = []
+    for _ in range(n):
+        sx = rng.randrange(0, 4_000_001)
+        sy = rng.randrange(0, 4_000_001)
+        bx = sx + rng.randrange(-500_000, 500_000)
+        by = sy + rng.randrange(-500_000, 500_000)
+        lines.append(
+            f'Sensor at x={sx}, y={sy}: closest beacon is at x={bx}, y={by}'
+        )
+    return '\n'.join(lines) + '\n'
+
+
+def day16(n, rng):
+    # n valves, a third of which have a positive flow rate
+    n = min(max(n, 2), 26 * 26)
+    names = ['AA'] + rng.sample([
+        a + b
+        for a in string.ascii_uppercase
+        for b in string.ascii_uppercase
+        if a + b != 'AA'
+    ], n-1)
+    tunnels = [set() for _ in range(n)]
+    edges = [(v, rng.randrange(v)) for v in range(1, n)]
+    edges += [tuple(rng.sample(range(n), 2)) for _ in range(n // 3)]
+    for a, b in edges:
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+    lines = []
+    for v in range(n):
+        rate = rng.randrange(1, 26) if v and rng.random() < 1/3 else 0
+        neighbours = ', '.join(names[t] for t in sorted(tunnels[v]))
+        if len(tunnels[v]) == 1:
+            tail = f'tunnel leads to valve {neighbours}'
+        else:
+            tail = f'tunnels lead to valves {neighbours}'
+        lines.append(f'Valve {names[v]} has flow rate={rate}; {tail}')
+    return '\n'.join(lines) + '\n'
+
+
+def day17(n, rng):
+    # n jets. On some random jets a column is never filled, so that the
+    # surface of the tower keeps getting deeper and part 2 never finds a
+    # cycle; those are drawn again, as real inputs never do that
+    from aoc import days
+    simulation = days.load(17).Simulation
+    while True:
+        jets = ''.join(rng.choices('<>', k=n))
+        tower = simulation([-1 if jet == '<' else 1 for jet in jets])
+        for _ in range(SETTLE):
+            tower.drop_rock()
+        tower.scroll()
+        if tower.top_y < SURFACE:
+            return jets + '\n'
+
+
+def day18(n, rng):
+    # n distinct cubes
+    side = round((4*n) ** (1/3)) + 1
+    return ''.join(
+        f'{c // side**2},{c // side % side},{c % side}\n'
+        for c in rng.sample(range(side**3), n)
+    )
+
+
+def day19(n, rng):
+    # n blueprints
+    return ''.join(
+        f'Blueprint {i}: '
+        f'Each ore robot costs {rng.randrange(2, 5)} ore. '
+        f'Each clay robot costs {rng.randrange(2, 5)} ore. '
+        f'Each obsidian robot costs {rng.randrange(2, 5)} ore '
+        f'and {rng.randrange(5, 21)} clay. '
+        f'Each geode robot costs {rng.randrange(2, 5)} ore '
+        f'and {rng.randrange(5, 21)} obsidian.\n'
+        for i in range(1, n+1)
+    )
+
+
+def day20(n, rng):
+    # n numbers, exactly one of which is zero
+    numbers = [
+        rng.choice([-1, 1]) * rng.randrange(1, 10_000)
+        for _ in range(n)
+    ]
+    numbers.insert(rng.randrange(n+1), 0)
+    return ''.join(f'{number}\n' for number in numbers)
+
+
+def day21(n, rng):
+    # n monkeys (rounded up to odd) in a tree, with humn as a left-most leaf
+    n = max(3, n | 1)
+    names = (
+        ''.join(string.ascii_lowercase[i // 26**k % 26] for k in range(4))
+        for i in rng.sample(range(26**4), n + 2)
+    )
+    names = (name for name in names if name not in ('root', 'humn'))
+    stack = [('root', rng.randrange(1, 1000), n, None)]
+    lines = []
+    while stack:
+        name, value, size, humn = stack.pop()
+        if size == 1:
+            lines.append(f'{name}: {value}')
+            continue
+        d = rng.randrange(1, 10)
+        op = rng.choice('+-*/')
+        if name == 'root':
+            op, lv, rv = '+', value, value
+        elif op == '*' and value % d == 0 and value != 0:
+            lv, rv = value // d, d
+        elif op == '/':
+            lv, rv = value * d, d
+        elif op == '-':
+            lv, rv = value + d, d
+        else:
+            op, lv, rv = '+', value - d, d
+        left = rng.randrange(1, size-1, 2)
+        lname = 'humn' if humn is not False and left == 1 else next(names)
+        rname = next(names)
+        lines.append(f'{name}: {lname} {op} {rname}')
+        stack.append((lname, lv, left, humn is not False))
+        stack.append((rname, rv, size-1-left, False))
+    rng.shuffle(lines)
+    return '\n'.join(lines) + '\n'
+
+
+def day22(n, rng):
+    # n instructions, on the cube net from the example with 50 by 50 tiles
+    size = 50
+    layout = ['..#.', '###.', '..##']
+    lines = []
+    for tiles in layout:
+        width = tiles.rindex('#') + 1
+        for _ in range(size):
+            lines.append(''.join(
+                ''.join(rng.choices('.#', [9, 1], k=size))
+                if tiles[col] == '#' else ' ' * size
+                for col in range(width)
+            ))
+    lines[0] = lines[0][:2*size] + '.' + lines[0][2*size+1:]
+    path = ''.join(
+        f'{rng.randrange(1, 2*size)}{rng.choice("LR")}'
+        for _ in range(n)
+    ) + str(rng.randrange(1, 2*size))
+    return '\n'.join(lines) + '\n\n' + path + '\n'
+
+
+def day23(n, rng):
+    # an n by n grove with a quarter of the spots taken by elves
+    return ''.join(
+        ''.join(rng.choices('.#', [3, 1], k=n)) + '\n'
+        for _ in range(n)
+    )
+
+
+def day24(n, rng):
+    # a valley n high and 3n wide, with blizzards on a quarter of it
+    width = 3 * n
+    lines = ['#.' + '#' * width]
+    for _ in range(n):
+        lines.append('#' + ''.join(
+            rng.choice('<>^v') if rng.random() < 0.25 else '.'
+            for _ in range(width)
+        ) + '#')
+    lines.append('#' * width + '.#')
+    return '\n'.join(lines) + '\n'
+
+
+def day25(n, rng):
+    # n SNAFU numbers
+    lines = []
+    for _ in range(n):
+        number = rng.randrange(1, 10**12)
+        chars = []
+        while number:
+            number, digit = divmod(number + 2, 5)
+            chars.append('=-012'[digit])
+        lines.append(''.join(reversed(chars)))
+    return '\n'.join(lines) + '\n'
+
+
+GENERATORS = {
+    day: globals()[f'day{day:02}']
+    for day in range(1, 26)
+}
+
+
+def generate(day, n, seed=0):
+    return GENERATORS[day](n, random.Random(seed))
@@ -0,0 +1,114 @@
+"""
+Time the solutions across a ladder of synthetic input sizes.
+
+The growth exponent k is fitted by least squares, assuming that the
+running time behaves like c * n**k for an input of size n. Each run is
+also appended to the history kept by aoc.bench.history.
+
+Each run of a solution has a budget of wall-clock time. Once a run goes
+over it, or fails, the larger sizes of that part are skipped, and the
+benchmark goes on with the next part, as it does past the sizes which
+generate.LIMIT sets for the solutions which grow exponentially.
+
+>>> round(exponent([(10, 0.5), (20, 2.0), (40, 8.0)]), 3)
+2.0
+>>> ladder(8, 3)
+[8, 16, 32]
+"""
+
+import math
+import statistics
+import tracemalloc
+
+from aoc import days as aoc_days
+from aoc import runner
+from aoc.bench import generate
+from aoc.bench import history
+
+
+def ladder(base, steps):
+    return [base * 2**i for i in range(steps)]
+
+
+def measure(day, part, n, repeat=3, seed=0, budget=None):
+    """
+    The median time taken to solve a generated input of size n, and the
+    peak memory allocated by one more run under tracemalloc.
+
+    Raises TimeoutError if a timed run takes longer than the budget.
+    """
+    # don't time the import of the solution
+    aoc_days.load(day)
+    input = generate.generate(day, n, seed)
+    times = []
+    for _ in range(repeat):
+        _, seconds = runner.attempt(day, part, input, budget)
+        times.append(seconds)
+    # the timed runs finished, so this one will too, however much slower
+    # it is under tracemalloc
+    tracemalloc.start()
+    try:
+        aoc_days.solve(day, part, input)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return statistics.median(times), peak
+
+
+def exponent(points):
+    """
+    Fit log(seconds) = k log(n) + c to a list of (n, seconds) points.
+    """
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(max(seconds, 1e-9)) for _, seconds in points]
+    mean_x = statistics.fmean(xs)
+    mean_y = statistics.fmean(ys)
+    var = sum((x - mean_x)**2 for x in xs)
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return cov / var
+
+
+def bench(day, part, sizes, repeat=3, results=None, budget=None):
+    """
+    Time one part at each size, printing a line per size as it goes, and
+    adding a result per size to the given list.
+    """
+    points = []
+    for n in sizes:
+        if n > generate.LIMIT.get(day, n):
+            print(f'day {day:02} part {part} n={n:<9} skipped, over the '
+                  f'limit of {generate.LIMIT[day]}')
+            break
+        try:
+            seconds, peak = measure(day, part, n, repeat, budget=budget)
+        except Exception as e:
+            print(f'day {day:02} part {part} n={n:<9} failed: {e!r}')
+            break
+        print(f'day {day:02} part {part} n={n:<9} {seconds:10.6f}s '
+              f'{peak / 1024:10.0f} KiB')
+        points.append((n, seconds))
+        if results is not None:
+            results.append({
+                'day': day, 'part': part, 'n': n,
+                'median': seconds, 'peak': peak,
+            })
+    if len(points) > 1:
+        print(f'day {day:02} part {part} grows like n**{exponent(points):.2f}')
+    return points
+
+
+def main(args):
+    parts = args.part or aoc_days.PARTS
+    run = history.new_run(repeat=args.repeat)
+    try:
+        for day in args.days or aoc_days.DAYS:
+            base = max(1, round(generate.BASE[day] * args.scale))
+            for part in parts:
+                if (day, part) not in generate.SKIP:
+                    bench(day, part, ladder(base, args.steps), args.repeat,
+                          run['results'], args.budget)
+    finally:
+        # keep what was measured, even if interrupted
+        if run['results']:
+            history.append(run)
+    return 0
@@ -0,0 +1,152 @@
+"""
+History of benchmark runs, and comparison against a stored baseline.
+
+Each run of `python3 -m aoc bench` appends a line of JSON to
+bench-history.jsonl, with the median time and peak memory of every
+(day, part) at every size it tried. `python3 -m aoc compare` then checks
+the latest measurement of each of them against bench-baseline.json, and
+fails if any median regressed by more than the threshold, so that it can
+gate changes to the solutions.
+
+>>> base = {'results': [{'day': 8, 'part': 1, 'n': 20, 'median': 0.010}]}
+>>> runs = [{'results': [{'day': 8, 'part': 1, 'n': 20, 'median': 0.05}]},
+...         {'results': [{'day': 8, 'part': 1, 'n': 20, 'median': 0.02}]}]
+>>> [(key, ratio) for key, _, _, ratio in compare(base, latest(runs))]
+[((8, 1, 20), 2.0)]
+>>> regressed(compare(base, latest(runs)), threshold=0.5)
+[(8, 1, 20)]
+>>> day9 = {'results': [{'day': 9, 'part': 1, 'n': 20, 'median': 0.03}]}
+>>> [(r['day'], r['median']) for r in latest([base, day9])['results']]
+[(8, 0.01), (9, 0.03)]
+"""
+
+import datetime
+import json
+import subprocess
+
+from aoc.days import ROOT, write_atomically
+
+HISTORY = ROOT / 'bench-history.jsonl'
+BASELINE = ROOT / 'bench-baseline.json'
+# differences smaller than this are noise, however large the ratio
+NOISE = 0.001
+
+
+def revision():
+    """
+    The current git revision, or None outside of a git checkout.
+    """
+    try:
+        return subprocess.run(
+            ['git', 'describe', '--always', '--dirty'],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def new_run(**fields):
+    return {
+        'time': datetime.datetime.now().isoformat(timespec='seconds'),
+        'revision': revision(),
+        **fields,
+        'results': [],
+    }
+
+
+def append(run, path=HISTORY):
+    with open(path, 'a') as f:
+        f.write(json.dumps(run) + '\n')
+
+
+def load(path=HISTORY):
+    try:
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def load_baseline(path=BASELINE):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(run, path=BASELINE):
+    write_atomically(path, json.dumps(run, indent=1))
+
+
+def latest(runs):
+    """
+    A run made of the latest result of each (day, part, n) in the runs.
+    """
+    results = {}
+    for run in runs:
+        for result in run['results']:
+            results[result['day'], result['part'], result['n']] = result
+    return {'results': [results[key] for key in sorted(results)]}
+
+
+def compare(baseline, current):
+    """
+    The (day, part, n) measured in both runs, each with its baseline and
+    current results, and the ratio of the current median to the baseline.
+    """
+    before = {
+        (result['day'], result['part'], result['n']): result
+        for result in baseline['results']
+    }
+    return [
+        (key, before[key], result, result['median'] / before[key]['median'])
+        for result in current['results']
+        if (key := (result['day'], result['part'], result['n'])) in before
+        and before[key]['median'] > 0
+    ]
+
+
+def regressed(comparison, threshold):
+    return [
+        key
+        for key, old, new, ratio in comparison
+        if ratio > 1 + threshold and new['median'] - old['median'] > NOISE
+    ]
+
+
+def _peak(result):
+    peak = result.get('peak')
+    return '' if peak is None else f'{peak / 1024:>10.0f} KiB'
+
+
+def main(args):
+    current = latest(load())
+    current['results'] = [
+        result for result in current['results']
+        if (not args.days or result['day'] in args.days)
+        and (not args.part or result['part'] in args.part)
+    ]
+    if not current['results']:
+        print('# no benchmark results, run `python3 -m aoc bench` first')
+        return 1
+    baseline = load_baseline()
+    if baseline is None:
+        print(f'# no baseline in {BASELINE.name}, use --update to save one')
+        comparison = []
+    else:
+        comparison = compare(baseline, current)
+    slower = set(regressed(comparison, args.threshold))
+    for key, old, new, ratio in comparison:
+        day, part, n = key
+        flag = '  REGRESSED' if key in slower else ''
+        print(
+            f'day {day:02} part {part} n={n:<9} '
+            f'{old["median"]:10.6f}s -> {new["median"]:10.6f}s '
+            f'x{ratio:<6.2f}{_peak(old)} ->{_peak(new)}{flag}'
+        )
+    if args.update:
+        # the days and parts which weren't selected keep their baseline
+        save_baseline(latest([baseline or {'results': []}, current]))
+        print(f'# saved the latest results to {BASELINE.name}')
+    return 1 if slower else 0
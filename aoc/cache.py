@@ -0,0 +1,109 @@
+"""
+On-disk cache of answers, keyed on everything that determines them.
+
+The key of a (day, part) answer hashes the input together with the
+source of the day's solve.py and of every module from this repository
+which it uses, so editing a shared helper invalidates the answers that
+depend on it while touching files without changing them doesn't.
+
+Entries live in .cache/results/, one small file per answer. Reading an
+entry refreshes its modification time, and once the directory outgrows
+its size limit the least recently used entries are evicted.
+
+>>> import tempfile
+>>> cache = Cache(tempfile.mkdtemp(), max_bytes=10)
+>>> cache.put('a', '12345'); cache.put('b', '67890')
+>>> cache.get('a'), cache.get('c')
+('12345', None)
+>>> cache.put('c', 'abc')
+>>> cache.get('a'), cache.get('b'), cache.get('c')
+('12345', None, 'abc')
+"""
+
+import hashlib
+import os
+from pathlib import Path
+import sys
+import time
+from types import ModuleType
+
+from aoc import days as aoc_days
+
+DIR = aoc_days.ROOT / '.cache' / 'results'
+MAX_BYTES = 1 << 20
+
+
+def _touch(path):
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+def sources(module):
+    """
+    The source files of a module and of the local modules it relies on.
+    """
+    seen = set()
+    stack = [module]
+    while stack:
+        module = stack.pop()
+        path = getattr(module, '__file__', None)
+        if path is None or path in seen or not aoc_days.is_local(path):
+            continue
+        seen.add(path)
+        for value in vars(module).values():
+            if not isinstance(value, ModuleType):
+                value = sys.modules.get(getattr(value, '__module__', None))
+            if value is not None:
+                stack.append(value)
+    return sorted(seen)
+
+
+def key(day, part, input):
+    h = hashlib.sha256()
+    kwargs = aoc_days.KWARGS.get((day, part), {})
+    h.update(f'{day} {part} {sorted(kwargs.items())}\n'.encode())
+    for path in sources(aoc_days.load(day)):
+        source = Path(path).read_bytes()
+        name = os.path.relpath(path, aoc_days.ROOT)
+        h.update(f'{name} {len(source)}\n'.encode())
+        h.update(source)
+    # inputs loaded by the solutions themselves may be arrays of bytes
+    h.update(input.encode() if isinstance(input, str) else input)
+    return h.hexdigest()
+
+
+class Cache:
+    def __init__(self, directory=DIR, max_bytes=MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def get(self, key):
+        path = self.directory / key
+        try:
+            answer = path.read_text()
+        except FileNotFoundError:
+            return None
+        _touch(path)
+        return answer
+
+    def put(self, key, answer):
+        path = self.directory / key
+        aoc_days.write_atomically(path, answer)
+        _touch(path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for path in self.directory.iterdir():
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
@@ -0,0 +1,138 @@
+"""
+Locate, load and call the daily solutions.
+
+>>> directory(1).name
+'day01'
+>>> solve(1, 2, load(1).TEST_INPUT)
+45000
+>>> parse_days(['25', '3-5', '1'])
+[1, 3, 4, 5, 25]
+"""
+
+import importlib.util
+import os
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+DAYS = range(1, 26)
+PARTS = (1, 2)
+
+# extra keyword arguments which the main() functions pass along
+KWARGS = {
+    (15, 1): {'y': 2_000_000},
+    (15, 2): {'bound': 4_000_000},
+    (22, 1): {'tile_size': 50},
+    (22, 2): {'tile_size': 50},
+}
+
+
+def directory(day):
+    return ROOT / f'day{day:02}'
+
+
+def input_path(day):
+    return directory(day) / 'input.txt'
+
+
+def output_path(day, part):
+    return directory(day) / f'output{part}.txt'
+
+
+def is_local(path):
+    """
+    Whether a source file belongs to this repository, rather than to the
+    standard library or to an installed package.
+    """
+    path = Path(path).resolve()
+    return path.is_relative_to(ROOT) and 'site-packages' not in path.parts
+
+
+def write_atomically(path, data):
+    """
+    Write text or bytes to a file by way of a temporary file beside it,
+    so that a reader sees either the old contents or the new ones, never
+    a part of them.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'{path.name}.tmp')
+    if isinstance(data, str):
+        tmp.write_text(data)
+    else:
+        tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def load(day):
+    """
+    Import day??/solve.py as the module day??, at most once per process.
+    """
+    name = f'day{day:02}'
+    if name in sys.modules:
+        return sys.modules[name]
+    path = directory(day) / 'solve.py'
+    if not path.exists():
+        raise ValueError(f'no solution for day {day}')
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def call(day, name, *args):
+    """
+    Call a function of a solution by name. Unlike the function itself,
+    this pickles by reference to a module which worker processes can
+    import, however they were started, so it may be sent to a pool.
+    """
+    return getattr(load(day), name)(*args)
+
+
+def solve(day, part, input):
+    module = load(day)
+    return getattr(module, f'part{part}')(input, **KWARGS.get((day, part), {}))
+
+
+def read_input(day):
+    return open(input_path(day)).read()
+
+
+def load_input(day):
+    """
+    The input of a day in the form its solution is given it: whatever
+    the solution's own read_input(path) function returns if it has one,
+    such as a memory-mapped array, and the text of input.txt otherwise.
+    """
+    reader = getattr(load(day), 'read_input', None)
+    if reader is None:
+        return read_input(day)
+    return reader(input_path(day))
+
+
+def write_output(day, part, answer):
+    with open(output_path(day, part), 'w') as f:
+        print(answer, file=f)
+
+
+def parse_days(args):
+    """
+    Turn command-line arguments like '7' or '3-5' into a sorted list of days.
+    """
+    days = set()
+    for arg in args:
+        first, sep, last = arg.partition('-')
+        try:
+            first = int(first)
+            last = int(last) if sep else first
+        except ValueError:
+            raise ValueError(f'invalid day: {arg!r}')
+        if not (first in DAYS and last in DAYS and first <= last):
+            raise ValueError(f'invalid day: {arg!r}')
+        days.update(range(first, last+1))
+    return sorted(days)
@@ -0,0 +1,213 @@
+"""
+Download the puzzle inputs, several at a time over a few connections
+which are kept alive from one input to the next.
+
+Each input is written atomically to day??/input.txt, and its checksum is
+recorded in .cache/inputs.json. Inputs which are already present and
+still match their checksum are skipped; those which no longer match are
+fetched again. Inputs which were put in place by hand, and so have no
+checksum yet, are trusted as they are.
+
+The base URL can point to any server, such as a local stand-in:
+
+>>> import http.server, tempfile, threading
+>>> class Handler(http.server.BaseHTTPRequestHandler):
+...     protocol_version = 'HTTP/1.1'
+...     def do_GET(self):
+...         body = f'{self.path} {self.headers["Cookie"]}\\n'.encode()
+...         self.send_response(200 if '/25/' not in self.path else 404)
+...         self.send_header('Content-Length', str(len(body)))
+...         self.end_headers()
+...         self.wfile.write(body)
+...     def log_message(self, *args):
+...         pass
+>>> httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+>>> threading.Thread(target=httpd.serve_forever, daemon=True).start()
+>>> url = f'http://127.0.0.1:{httpd.server_port}/2022'
+>>> root = tempfile.mkdtemp()
+>>> fetch([1, 2, 25], url, 'session=x', root)
+# day 01 fetched (28 bytes)
+# day 02 fetched (28 bytes)
+# day 25 failed: HTTP 404 Not Found
+1
+>>> print(open(f'{root}/day02/input.txt').read(), end='')
+/2022/day/2/input session=x
+>>> fetch([1, 2], url, 'session=x', root)
+# day 01 already present
+# day 02 already present
+0
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import http.client
+import json
+from pathlib import Path
+import threading
+import urllib.parse
+
+from aoc import days as aoc_days
+
+URL = 'https://adventofcode.com/2022'
+SESSION = aoc_days.ROOT / 'session.txt'
+WORKERS = 4
+USER_AGENT = 'python3 -m aoc fetch (Advent of Code 2022 solutions)'
+
+
+def read_cookie(path=SESSION):
+    """
+    The session cookie, from a file in any of the formats accepted by
+    `curl --cookie`: a cookie jar, a name=value pair, or just the value.
+    """
+    text = Path(path).read_text().strip()
+    for line in text.splitlines():
+        fields = line.split('\t')
+        if len(fields) == 7 and fields[5] == 'session':
+            return f'session={fields[6]}'
+    if '=' in text:
+        return text.splitlines()[0]
+    return f'session={text}'
+
+
+def checksum(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+class Pool:
+    """
+    Connections to the host of a base URL, one per thread, each kept
+    alive for as long as the server allows.
+    """
+
+    def __init__(self, url):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme == 'https':
+            self.connection_class = http.client.HTTPSConnection
+        elif parts.scheme == 'http':
+            self.connection_class = http.client.HTTPConnection
+        else:
+            raise ValueError(f'invalid URL: {url!r}')
+        self.netloc = parts.netloc
+        self.prefix = parts.path.rstrip('/')
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def connection(self):
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = self.connection_class(self.netloc, timeout=30)
+            self.local.connection = connection
+            with self.lock:
+                self.connections.append(connection)
+        return connection
+
+    def drop(self):
+        self.local.connection.close()
+        self.local.connection = None
+
+    def get(self, path, headers):
+        """
+        The status, reason and body of the response to a GET request.
+        """
+        # a kept-alive connection may have been closed by the server in
+        # the meantime, in which case it's worth trying once more
+        for retry in (True, False):
+            connection = self.connection()
+            try:
+                connection.request('GET', self.prefix + path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (ConnectionError, http.client.HTTPException):
+                self.drop()
+                if retry:
+                    continue
+                raise
+            if response.will_close:
+                self.drop()
+            return response.status, response.reason, body
+
+    def close(self):
+        with self.lock:
+            for connection in self.connections:
+                connection.close()
+            self.connections.clear()
+
+
+def download(pool, day, cookie):
+    status, reason, body = pool.get(
+        f'/day/{day}/input',
+        {'Cookie': cookie, 'User-Agent': USER_AGENT},
+    )
+    if status != 200:
+        raise ValueError(f'HTTP {status} {reason}')
+    return body
+
+
+def load_manifest(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def fetch(days, url=URL, cookie=None, root=aoc_days.ROOT, workers=WORKERS,
+          force=False):
+    """
+    Fetch the inputs of the given days which are missing or outdated,
+    and return how many of them couldn't be fetched.
+    """
+    root = Path(root)
+    manifest_path = root / '.cache' / 'inputs.json'
+    manifest = load_manifest(manifest_path)
+    outcomes = {}
+    missing = []
+    for day in days:
+        path = root / f'day{day:02}' / 'input.txt'
+        if not force and path.exists():
+            digest = checksum(path.read_bytes())
+            if manifest.get(str(day), digest) == digest:
+                manifest[str(day)] = digest
+                outcomes[day] = 'already present'
+                continue
+        missing.append(day)
+
+    if missing:
+        if cookie is None:
+            cookie = read_cookie()
+        with Pool(url) as pool, ThreadPoolExecutor(workers) as executor:
+            downloads = {
+                day: executor.submit(download, pool, day, cookie)
+                for day in missing
+            }
+            for day, future in downloads.items():
+                try:
+                    data = future.result()
+                except Exception as e:
+                    outcomes[day] = f'failed: {e}'
+                    continue
+                aoc_days.write_atomically(
+                    root / f'day{day:02}' / 'input.txt', data)
+                manifest[str(day)] = checksum(data)
+                outcomes[day] = f'fetched ({len(data)} bytes)'
+
+    aoc_days.write_atomically(manifest_path, json.dumps(manifest, indent=1))
+    for day in sorted(outcomes):
+        print(f'# day {day:02} {outcomes[day]}')
+    return sum(outcome.startswith('failed') for outcome in outcomes.values())
+
+
+def main(args):
+    cookie = None if args.session is None else read_cookie(args.session)
+    failed = fetch(
+        args.days or aoc_days.DAYS, args.url, cookie,
+        workers=args.workers, force=args.force,
+    )
+    return 1 if failed else 0
@@ -0,0 +1,227 @@
+"""
+Dense grids backed by NumPy arrays, for the puzzles set on a grid.
+
+A Grid wraps an array of cells together with the coordinates of its
+first cell, so that solutions keep their own coordinates, negative ones
+included, while each cell takes a byte or so instead of the hundred or
+so bytes of a tuple in a set or dict. Coordinates are in the order of
+the axes of the array, for instance (row, column).
+
+Single cells are read and written through bounds-checked indexing, and
+whole grids are best handled as boolean masks, moved around by shift()
+and combined with the usual NumPy operators.
+
+>>> g = Grid.parse('S.#\\n..E\\n').translate({'.': 0, '#': 1, 'S': 2, 'E': 3})
+>>> g.shape, g[0, 2], (1, 3) in g
+((2, 3), 1, False)
+>>> sorted(g.neighbours((0, 0)))
+[(0, 1), (1, 0)]
+>>> g = g.pad(1, fill=1)
+>>> g.origin, g[-1, -1], g[1, 2]
+((-1, -1), 1, 3)
+>>> g[3, 0]
+Traceback (most recent call last):
+...
+IndexError: point out of bounds: (3, 0)
+>>> walls = Grid.from_points([(-1, 5), (1, 7)])
+>>> walls.origin, walls.shape, walls.points().tolist()
+((-1, 5), (3, 3), [[-1, 5], [1, 7]])
+>>> shift(np.array([1, 2, 3]), (1,))
+array([0, 1, 2])
+"""
+
+import itertools
+
+import numpy as np
+
+
+def directions(ndim=2, diagonal=False):
+    """
+    The offsets from a cell to its neighbours along the axes, and also
+    diagonally if asked to.
+
+    >>> directions(2)
+    [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    >>> len(directions(2, diagonal=True)), len(directions(3))
+    (8, 6)
+    """
+    if diagonal:
+        return [
+            offset
+            for offset in itertools.product((-1, 0, 1), repeat=ndim)
+            if any(offset)
+        ]
+    return [
+        tuple(step if i == axis else 0 for i in range(ndim))
+        for axis in range(ndim)
+        for step in (-1, 1)
+    ]
+
+
+def shift(array, offset, fill=0):
+    """
+    A copy of an array moved by the given offset along each axis, with
+    the cells left behind set to fill.
+
+    >>> shift(np.arange(6).reshape(2, 3), (1, -1), fill=-1)
+    array([[-1, -1, -1],
+           [ 1,  2, -1]])
+    """
+    result = np.full_like(array, fill)
+    src = []
+    dst = []
+    for size, step in zip(array.shape, offset, strict=True):
+        if abs(step) >= size:
+            return result
+        src.append(slice(max(-step, 0), size - max(step, 0)))
+        dst.append(slice(max(step, 0), size - max(-step, 0)))
+    result[tuple(dst)] = array[tuple(src)]
+    return result
+
+
+def dilate(mask, offsets):
+    """
+    A boolean mask together with its copies moved by each offset.
+
+    >>> dilate(np.array([False, True, False, False]), [(1,)])
+    array([False,  True,  True, False])
+    """
+    result = mask.copy()
+    for offset in offsets:
+        result |= shift(mask, offset)
+    return result
+
+
+class Grid:
+    def __init__(self, cells, origin=None):
+        self.cells = np.asarray(cells)
+        if origin is None:
+            origin = (0,) * self.cells.ndim
+        self.origin = tuple(origin)
+
+    @classmethod
+    def parse(cls, text):
+        """
+        A grid of the character codes of a text, one row per line.
+        """
+        lines = text.splitlines()
+        if not lines:
+            raise ValueError('empty grid')
+        width = len(lines[0])
+        if any(len(line) != width for line in lines):
+            raise ValueError('uneven lines')
+        data = bytearray(''.join(lines), 'ascii')
+        return cls(np.frombuffer(data, np.uint8).reshape(len(lines), width))
+
+    @classmethod
+    def from_points(cls, points, lower=None, upper=None):
+        """
+        A boolean grid of the given points, spanning from lower to upper
+        inclusive, by default just enough to hold the points.
+        """
+        points = np.array(list(points), dtype=int)
+        lower = np.array(points.min(axis=0) if lower is None else lower)
+        upper = np.array(points.max(axis=0) if upper is None else upper)
+        cells = np.zeros(upper - lower + 1, dtype=bool)
+        if len(points):
+            if ((points < lower) | (points > upper)).any():
+                raise ValueError('points out of bounds')
+            cells[tuple((points - lower).T)] = True
+        return cls(cells, lower.tolist())
+
+    def __repr__(self):
+        return f'Grid(origin={self.origin}, shape={self.shape})'
+
+    @property
+    def shape(self):
+        return self.cells.shape
+
+    @property
+    def ndim(self):
+        return self.cells.ndim
+
+    def _index(self, point):
+        index = tuple(p - o for p, o in zip(point, self.origin))
+        if len(point) != self.ndim or not all(
+            0 <= i < size for i, size in zip(index, self.shape)
+        ):
+            raise IndexError(f'point out of bounds: {point}')
+        return index
+
+    def __contains__(self, point):
+        return len(point) == self.ndim and all(
+            0 <= p - o < size
+            for p, o, size in zip(point, self.origin, self.shape)
+        )
+
+    def __getitem__(self, point):
+        return self.cells[self._index(point)].item()
+
+    def __setitem__(self, point, value):
+        self.cells[self._index(point)] = value
+
+    def neighbours(self, point, offsets=None):
+        """
+        The neighbours of a point which lie within the grid.
+        """
+        for offset in offsets or directions(self.ndim):
+            neighbour = tuple(p + d for p, d in zip(point, offset))
+            if neighbour in self:
+                yield neighbour
+
+    def translate(self, values, dtype=None):
+        """
+        Map the characters of a parsed grid to values, such as heights.
+
+        By default the values take the smallest type which holds them.
+        """
+        if dtype is None:
+            dtype = np.result_type(*map(np.min_scalar_type, values.values()))
+        table = np.zeros(256, dtype=dtype)
+        valid = np.zeros(256, dtype=bool)
+        for char, value in values.items():
+            table[ord(char)] = value
+            valid[ord(char)] = True
+        invalid = np.argwhere(~valid[self.cells])
+        if len(invalid):
+            char = chr(self.cells[tuple(invalid[0])])
+            raise ValueError(f'invalid character: {char!r}')
+        return Grid(table[self.cells], self.origin)
+
+    def pad(self, width, fill=0):
+        """
+        A larger grid, with width more cells on each side, or as given
+        per axis by (before, after) pairs as for numpy.pad().
+        """
+        width = np.broadcast_to(width, (self.ndim, 2))
+        cells = np.pad(self.cells, width, constant_values=fill)
+        return Grid(cells, np.subtract(self.origin, width[:, 0]).tolist())
+
+    def points(self, mask=None):
+        """
+        The coordinates of the cells that are set, or that are set in a
+        mask of the same shape, as an array with one row per point.
+        """
+        return np.argwhere(self.cells if mask is None else mask) + self.origin
+
+    def take(self, points):
+        """
+        The values at an array of points, which must lie within the grid.
+        """
+        return self.cells[tuple((np.asarray(points) - self.origin).T)]
+
+    def put(self, points, value):
+        self.cells[tuple((np.asarray(points) - self.origin).T)] = value
+
+    def moves(self, points, offsets=None):
+        """
+        Every move by one of the offsets from an array of points which
+        stays within the grid, as arrays of sources and destinations.
+        """
+        points = np.asarray(points).reshape(-1, self.ndim)
+        offsets = np.array(offsets or directions(self.ndim))
+        src = np.repeat(points, len(offsets), axis=0)
+        dst = (points[:, None, :] + offsets).reshape(-1, self.ndim)
+        lower = np.array(self.origin)
+        inside = ((dst >= lower) & (dst < lower + self.shape)).all(axis=1)
+        return src[inside], dst[inside]
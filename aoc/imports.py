@@ -0,0 +1,132 @@
+"""
+How long it takes a fresh process to import each solution, and which
+modules that time goes to, as measured by `python3 -X importtime`.
+
+Each day is imported in a process of its own, so that it is charged for
+everything it imports, the aoc package included, but not for what the
+interpreter imports before any of our code runs. The solution itself
+isn't imported through the import system, so its own line is added from
+a timing taken around aoc.days.load().
+
+>>> report = parse('''\\
+... import time: self [us] | cumulative | imported package
+... import time:       200 |        200 | encodings
+... import time: aoc.imports start
+... import time:       100 |        100 |   pathlib
+... import time:        50 |        150 | aoc.days
+... import time:      1000 |       1000 | numpy
+... import time: aoc.imports day12 1600
+... ''')
+>>> for name, own, total in report:
+...     print(f'{name} {own} {total}')
+day12 450 1600
+pathlib 100 100
+aoc.days 50 150
+numpy 1000 1000
+"""
+
+import re
+import subprocess
+import sys
+
+from aoc import days as aoc_days
+
+# how many times to import each solution, keeping the fastest
+REPEAT = 3
+# how many of the slowest modules to list by default
+TOP = 10
+
+_line_re = re.compile(
+    r'import time: +(?P<own>\d+) \| +(?P<total>\d+) \| (?P<name> *\S+)')
+_marker = 'import time: aoc.imports'
+
+_CHILD = f"""\
+import sys, time
+print('{_marker} start', file=sys.stderr)
+start = time.perf_counter_ns()
+from aoc import days
+module = days.load({{day}})
+elapsed = (time.perf_counter_ns() - start) // 1000
+print(f'{_marker} {{{{module.__name__}}}} {{{{elapsed}}}}', file=sys.stderr)
+"""
+
+
+def parse(stderr):
+    """
+    Turn the output of -X importtime into (module, self, cumulative)
+    triples in microseconds, the solution first and then the modules in
+    the order in which they finished importing.
+    """
+    modules = []
+    started = False
+    for line in stderr.splitlines():
+        if line.startswith(_marker):
+            words = line[len(_marker):].split()
+            if words[0] == 'start':
+                started = True
+                continue
+            name, total = words[0], int(words[1])
+            # whatever the imports at the top level don't account for was
+            # spent running the solution itself
+            own = total - sum(
+                cumulative for _, _, cumulative, depth in modules
+                if depth == 0)
+            return [(name, own, total)] + [
+                module[:3] for module in modules]
+        match = _line_re.fullmatch(line)
+        if started and match:
+            name = match['name']
+            depth = (len(name) - len(name.lstrip())) // 2
+            modules.append(
+                (name.strip(), int(match['own']), int(match['total']), depth))
+    raise ValueError('no timing for the solution')
+
+
+def measure(day, repeat=REPEAT):
+    """
+    Import a day's solution in fresh processes, and return the report of
+    the fastest of them.
+    """
+    reports = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c',
+             _CHILD.format(day=day)],
+            cwd=aoc_days.ROOT, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            raise ValueError(result.stderr.strip().splitlines()[-1])
+        reports.append(parse(result.stderr))
+    return min(reports, key=lambda report: report[0][2])
+
+
+def table(report, top=TOP):
+    """
+    The modules which took longest to import by themselves.
+    """
+    lines = [f'{"self ms":>9} {"cumul ms":>9}   module']
+    for name, own, total in sorted(report, key=lambda m: -m[1])[:top]:
+        lines.append(f'{own / 1000:>9.1f} {total / 1000:>9.1f}   {name}')
+    return '\n'.join(lines)
+
+
+def main(args):
+    over = 0
+    for day in args.days or aoc_days.DAYS:
+        try:
+            report = measure(day, args.repeat)
+        except ValueError as e:
+            print(f'# day {day:02} failed: {e}')
+            over += 1
+            continue
+        # the solution's cumulative time includes the aoc package too
+        total = report[0][2]
+        flag = ''
+        if args.budget is not None and total > args.budget * 1000:
+            over += 1
+            flag = f', over the budget of {args.budget:g} ms'
+        print(f'# day {day:02} ({total / 1000:.1f} ms, '
+              f'{len(report)} modules{flag})')
+        if args.top:
+            print(table(report, args.top))
+    return 1 if over else 0
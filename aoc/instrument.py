@@ -0,0 +1,169 @@
+"""
+Optional accounting of the time and memory spent in each phase of the
+solutions, such as parsing.
+
+Solutions mark their phases by decorating functions, generator functions
+included, with timed():
+
+    @instrument.timed('parse')
+    def parse(input):
+        ...
+
+Unless instrumentation was enabled before the solution was imported,
+timed() returns the function unchanged, so that there is no overhead at
+all in normal runs. Callers can also wrap a block in a phase() context.
+
+Time spent in a nested phase is only counted towards the inner phase.
+Peak memory is only tracked while tracemalloc is tracing, and is the
+highest allocation above the level at which the phase started.
+
+>>> enable()
+>>> @timed('parse')
+... def parse(input):
+...     for line in input.splitlines():
+...         yield int(line)
+>>> with phase('solve'):
+...     total = sum(parse('1\\n2\\n3\\n'))
+>>> phases = collect()
+>>> sorted(phases), phases['parse']['calls'], phases['solve']['calls']
+(['parse', 'solve'], 1, 1)
+>>> collect()
+{}
+"""
+
+import contextlib
+import functools
+import time
+
+_enabled = False
+_stack = []
+_phases = {}
+
+
+class _Frame:
+    def __init__(self, name, memory):
+        self.name = name
+        self.start = time.perf_counter()
+        self.children = 0.0
+        self.memory = memory
+        self.peak = memory
+
+
+def enable():
+    # tracemalloc is only needed once enabled, and slow to import
+    global _enabled, tracemalloc
+    import tracemalloc
+    _enabled = True
+
+
+def enabled():
+    return _enabled
+
+
+def _enter(name, calls=1):
+    memory = 0
+    if tracemalloc.is_tracing():
+        memory, peak = tracemalloc.get_traced_memory()
+        if _stack:
+            _stack[-1].peak = max(_stack[-1].peak, peak)
+        tracemalloc.reset_peak()
+    _stack.append(_Frame(name, memory))
+    record = _phases.setdefault(name, {'calls': 0, 'seconds': 0.0, 'peak': 0})
+    record['calls'] += calls
+
+
+def _exit():
+    frame = _stack.pop()
+    elapsed = time.perf_counter() - frame.start
+    record = _phases[frame.name]
+    record['seconds'] += elapsed - frame.children
+    if _stack:
+        _stack[-1].children += elapsed
+    if tracemalloc.is_tracing():
+        _, peak = tracemalloc.get_traced_memory()
+        peak = max(frame.peak, peak)
+        record['peak'] = max(record['peak'], peak - frame.memory)
+        if _stack:
+            _stack[-1].peak = max(_stack[-1].peak, peak)
+        tracemalloc.reset_peak()
+
+
+@contextlib.contextmanager
+def _phase(name):
+    _enter(name)
+    try:
+        yield
+    finally:
+        _exit()
+
+
+def phase(name):
+    """
+    A context which accounts for its body as the given phase.
+    """
+    if _enabled:
+        return _phase(name)
+    return contextlib.nullcontext()
+
+
+def timed(name):
+    """
+    A decorator which accounts for calls to a function as the given phase.
+    """
+    def decorator(func):
+        if not _enabled:
+            return func
+        # only needed once enabled, and slow to import
+        import inspect
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                gen = func(*args, **kwargs)
+                calls = 1
+                while True:
+                    # only count the time spent producing the items
+                    _enter(name, calls)
+                    calls = 0
+                    try:
+                        item = next(gen)
+                    except StopIteration as stop:
+                        return stop.value
+                    finally:
+                        _exit()
+                    yield item
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                _enter(name)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    _exit()
+        return wrapper
+    return decorator
+
+
+def collect():
+    """
+    Return the phases recorded so far, and start afresh.
+    """
+    global _phases
+    phases, _phases = _phases, {}
+    return phases
+
+
+def table(phases):
+    """
+    Format the result of collect() for humans.
+
+    >>> print(table({'parse': {'calls': 3, 'seconds': 0.5, 'peak': 2048}}))
+    phase         calls      seconds   peak KiB
+    parse             3     0.500000        2.0
+    """
+    lines = [f'{"phase":<10} {"calls":>8} {"seconds":>12} {"peak KiB":>10}']
+    for name, record in phases.items():
+        lines.append(
+            f'{name:<10} {record["calls"]:>8} {record["seconds"]:>12.6f} '
+            f'{record["peak"] / 1024:>10.1f}'
+        )
+    return '\n'.join(lines)
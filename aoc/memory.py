@@ -0,0 +1,123 @@
+"""
+Peak memory used by a solution, and the source lines which allocated it.
+
+tracemalloc keeps track of the peak, but only as a number. To find out
+what made up the peak, a thread polls the traced memory while the part
+runs and takes a snapshot each time it grows well past the size at the
+previous snapshot, so that the last snapshot is taken close to the peak.
+Allocations are put down to the innermost line of the solutions or of
+the aoc package, rather than to the library function which made them.
+Taking a snapshot needs memory of its own, in proportion to the number
+of live allocations, which isn't counted towards the peak.
+
+>>> import time
+>>> with tracking() as usage:
+...     blocks = [bytearray(1000) for _ in range(10_000)]
+...     time.sleep(2 * INTERVAL)
+>>> usage['peak'] > 10_000_000, usage['top'][0][0].startswith('<doctest')
+(True, True)
+"""
+
+import collections
+import contextlib
+import os
+import threading
+import tracemalloc
+
+from aoc.days import ROOT, is_local
+
+# how often to poll the traced memory, in seconds
+INTERVAL = 0.01
+# how much it must grow past the last snapshot for another one
+GROWTH = 1.5
+# how many source lines to report
+TOP = 5
+# how deep to look for a line of our own behind each allocation
+FRAMES = 10
+
+
+def _where(traceback):
+    # frames go from the oldest to the most recent
+    frame = next(
+        (frame for frame in reversed(traceback)
+         if is_local(frame.filename)),
+        traceback[-1],
+    )
+    path = frame.filename
+    if is_local(path):
+        path = os.path.relpath(path, ROOT)
+    return f'{path}:{frame.lineno}'
+
+
+def _top(snapshot, top):
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        # the poller
+        tracemalloc.Filter(False, __file__, all_frames=True),
+    ])
+    sizes = collections.Counter()
+    for stat in snapshot.statistics('traceback'):
+        sizes[_where(stat.traceback)] += stat.size
+    return [list(item) for item in sizes.most_common(top)]
+
+
+@contextlib.contextmanager
+def tracking(top=TOP):
+    """
+    A context which measures the peak memory allocated by its body.
+
+    It yields a dictionary which is filled on the way out, even if the
+    body raised, with the peak in bytes and the largest allocations at
+    the time of the last snapshot, as [source line, bytes] pairs.
+    """
+    usage = {}
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(FRAMES)
+    # only count what the body allocates
+    tracemalloc.clear_traces()
+    peak = 0
+    lines = []
+    done = threading.Event()
+
+    def poll():
+        nonlocal peak, lines
+        threshold = 0
+        while not done.wait(INTERVAL):
+            current, highest = tracemalloc.get_traced_memory()
+            if current > threshold:
+                lines = _top(tracemalloc.take_snapshot(), top)
+                threshold = current * GROWTH
+                # leave the memory used by the snapshot out of the peak
+                peak = max(peak, highest)
+                tracemalloc.reset_peak()
+
+    poller = threading.Thread(target=poll, daemon=True)
+    poller.start()
+    try:
+        yield usage
+    finally:
+        done.set()
+        poller.join()
+        usage['peak'] = max(peak, tracemalloc.get_traced_memory()[1])
+        usage['top'] = lines or _top(tracemalloc.take_snapshot(), top)
+        if started:
+            tracemalloc.stop()
+
+
+def table(usage):
+    """
+    Format what tracking() measured for humans.
+
+    >>> print(table({'peak': 3072, 'top': [['day18/solve.py:40', 2048]]}))
+      peak KiB   line
+           3.0   (peak)
+           2.0   day18/solve.py:40
+    """
+    lines = [
+        f'{"peak KiB":>10}   line',
+        f'{usage["peak"] / 1024:>10.1f}   (peak)',
+    ]
+    for where, size in usage['top']:
+        lines.append(f'{size / 1024:>10.1f}   {where}')
+    return '\n'.join(lines)
@@ -0,0 +1,249 @@
+"""
+Helpers shared by the parsers of the daily solutions.
+
+Besides reading inputs line by line, this provides bulk parsers for
+inputs whose lines all follow a fixed schema, given as a compiled regular
+expression for one line. Rather than matching line by line, the input is
+validated by a single pass of the regular expression engine, and the
+fields of all the lines are then extracted by a single scan. This is
+done on chunks of about a megabyte at a time, to bound memory use.
+
+Regular expressions kept at the top level of a module can be wrapped in
+LazyPattern, so that importing the module doesn't compile them.
+
+>>> list(lines('a\\nb\\n'))
+['a', 'b']
+>>> import io
+>>> list(lines(io.StringIO('a\\nb\\n')))
+['a', 'b']
+>>> move_re = re.compile(r'([UDLR]) (0|[1-9]\\d*)')
+>>> list(fields('R 4\\nU 12\\n', move_re))
+[('R', '4'), ('U', '12')]
+>>> list(fields('R 4\\nup 12\\n', move_re))
+Traceback (most recent call last):
+...
+ValueError: invalid line: 'up 12'
+>>> list(fields('R 4\\nup 12\\n', move_re, message='invalid move'))
+Traceback (most recent call last):
+...
+ValueError: invalid move: 'up 12'
+>>> op_re = re.compile(r'noop|addx (-?\\d+)')
+>>> list(fields('noop\\naddx 3\\nnoop\\n', op_re))
+['', '3', '']
+>>> point_re = re.compile(r'x=(-?\\d+), y=(-?\\d+)')
+>>> list(records('x=1, y=-2\\nx=3, y=4', point_re))
+[(1, -2), (3, 4)]
+"""
+
+import functools
+import re
+
+
+class LazyPattern:
+    """
+    A regular expression which is only compiled once it is first used,
+    and otherwise behaves like the compiled one.
+
+    >>> move_re = LazyPattern(r'([UDLR]) (0|[1-9]\\d*)')
+    >>> move_re.fullmatch('R 4').groups(), move_re.groups
+    (('R', '4'), 2)
+    """
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = pattern
+        self.flags = flags
+
+    def __getattr__(self, name):
+        # only called for attributes which aren't set yet, so keeping
+        # the methods of the compiled pattern makes later calls as fast
+        value = getattr(re.compile(self.pattern, self.flags), name)
+        setattr(self, name, value)
+        return value
+
+
+SIGNED_RE = LazyPattern(r'-?\d+')
+UNSIGNED_RE = LazyPattern(r'\d+')
+
+
+def lines(input):
+    """
+    The lines of an input, without their line endings.
+
+    The input is either a string, which is split at once, or any other
+    iterable of lines, such as an open file, which is read lazily.
+    """
+    if isinstance(input, str):
+        return input.splitlines()
+    return (line.rstrip('\n') for line in input)
+
+
+def ints(text, signed=True):
+    """
+    All the integers in a text, in order.
+
+    >>> ints('2-4,6-8'), ints('2-4,6-8', signed=False)
+    ([2, -4, 6, -8], [2, 4, 6, 8])
+    >>> ints('x=--3, y=4-')
+    [-3, 4]
+    """
+    # blanking out everything else and splitting is much faster than
+    # scanning with findall(), but leaves stray minus signs in odd cases
+    keep = '0123456789-' if signed else '0123456789'
+    table = dict.fromkeys(map(ord, set(text).difference(keep)), ' ')
+    blanked = text.translate(table)
+    if signed:
+        blanked = blanked.replace('-', ' -')
+    try:
+        return list(map(int, blanked.split()))
+    except ValueError:
+        int_re = SIGNED_RE if signed else UNSIGNED_RE
+        return list(map(int, int_re.findall(text)))
+
+
+def _non_capturing(pattern):
+    # turn the capturing groups of a pattern into non-capturing ones
+    out = []
+    escaped = in_class = False
+    for i, c in enumerate(pattern):
+        if escaped:
+            escaped = False
+        elif c == '\\':
+            escaped = True
+        elif in_class:
+            # a ] right at the start of a class is a literal
+            in_class = (
+                c != ']' or pattern[i - 1] == '[' or pattern[i - 2:i] == '[^'
+            )
+        elif c == '[':
+            in_class = True
+        elif c == '(' and not pattern.startswith('?', i + 1):
+            c = '(?:'
+        out.append(c)
+    return ''.join(out)
+
+
+@functools.cache
+def _whole_re(line_re):
+    # groups which capture make the repetition much slower to match, and
+    # aren't needed to validate (backreferences to them are unsupported)
+    pattern = _non_capturing(line_re.pattern)
+    return re.compile(f'(?:(?:{pattern})\\n)*', line_re.flags)
+
+
+@functools.cache
+def _anchored_re(line_re):
+    return re.compile(f'^(?:{line_re.pattern})$', line_re.flags | re.M)
+
+
+def chunks(input, size=1 << 20, sep='\n'):
+    """
+    Split a text into pieces of about the given size, each of which ends
+    with the separator, except maybe the last one.
+
+    The input is either a string, or a file or any other iterable of
+    lines, which is read lazily. Bytes, and files opened in binary mode,
+    are split into bytes.
+
+    >>> list(chunks('ab\\ncd\\nef', size=4))
+    ['ab\\ncd\\n', 'ef']
+    >>> import io
+    >>> list(chunks(io.StringIO('1\\n\\n2\\n3\\n\\n4\\n'), 4, '\\n\\n'))
+    ['1\\n\\n', '2\\n3\\n\\n', '4\\n']
+    >>> list(chunks(iter(['ab', 'cd', 'ef']), size=4))
+    ['ab\\ncd\\n', 'ef\\n']
+    >>> list(chunks(io.BytesIO(b'ab\\ncd\\n'), size=2))
+    [b'ab\\n', b'cd\\n']
+    """
+    if isinstance(input, (str, bytes)):
+        if isinstance(input, bytes):
+            sep = sep.encode()
+        start = 0
+        while start < len(input):
+            end = input.find(sep, start + size - 1)
+            end = len(input) if end < 0 else end + len(sep)
+            yield input[start:end]
+            start = end
+        return
+    rest = None
+    for block in _blocks(input, size):
+        if rest is None:
+            rest = block[:0]
+            if isinstance(block, bytes):
+                sep = sep.encode()
+        block = rest + block
+        end = block.rfind(sep)
+        if end < 0:
+            rest = block
+            continue
+        end += len(sep)
+        yield block[:end]
+        rest = block[end:]
+    if rest:
+        yield rest
+
+
+def _blocks(input, size):
+    if hasattr(input, 'read'):
+        while block := input.read(size):
+            yield block
+        return
+    # lines are gathered until they add up to about the size
+    block = []
+    length = 0
+    for line in lines(input):
+        block.append(line + '\n')
+        length += len(line) + 1
+        if length >= size:
+            yield ''.join(block)
+            block = []
+            length = 0
+    if block:
+        yield ''.join(block)
+
+
+def validate(text, line_re, message='invalid line'):
+    """
+    Check that every line of a text fully matches a regular expression.
+
+    Raises ValueError with the message, naming the first line which
+    doesn't, so that each solution can keep the message of its own
+    line-by-line parser.
+    """
+    if not text.endswith('\n'):
+        text += '\n'
+    if _whole_re(line_re).fullmatch(text) is None:
+        for line in text.splitlines():
+            if line_re.fullmatch(line) is None:
+                raise ValueError(f'{message}: {line!r}')
+        raise ValueError('invalid line endings')
+
+
+def fields(text, line_re, message='invalid line'):
+    """
+    The groups of each line of a text, validating the text as it goes
+    with the given error message.
+
+    As with re.findall(), the fields of a line come as a tuple of strings
+    if there are several groups, with '' for groups which didn't match.
+    """
+    for chunk in chunks(text):
+        validate(chunk, line_re, message)
+        yield from _anchored_re(line_re).findall(chunk)
+
+
+def records(text, line_re, signed=True, message='invalid line'):
+    """
+    The integers on each line of a text, as one tuple per line, the text
+    being validated as for fields().
+
+    Each group of the regular expression must match exactly one integer,
+    and there must be no other integers on the line.
+    """
+    size = line_re.groups
+    for chunk in chunks(text):
+        validate(chunk, line_re, message)
+        numbers = ints(chunk, signed)
+        count = chunk.count('\n') + (not chunk.endswith('\n'))
+        if len(numbers) != size * count:
+            raise ValueError(f'expected {size} integers per line')
+        yield from zip(*[iter(numbers)] * size)
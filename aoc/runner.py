@@ -0,0 +1,174 @@
+"""
+Run the solutions for several days and parts in a single process.
+
+Each day??/solve.py is imported once, its input.txt is read once, and
+the answers are written to output1.txt and output2.txt exactly as the
+per-day `python3 solve.py N` invocations would.
+
+>>> jobs([2, 1], [1, 2])
+[(2, 1), (2, 2), (1, 1), (1, 2)]
+>>> attempt(1, 1, '1\\n2\\n\\n4\\n', timeout=10)[0]
+4
+"""
+
+import contextlib
+import json
+import signal
+import sys
+import time
+import tracemalloc
+
+from aoc import cache as aoc_cache
+from aoc import days as aoc_days
+from aoc import instrument
+from aoc import memory as aoc_memory
+from aoc import snapshot
+from aoc import stats as aoc_stats
+
+
+class _Alarm(BaseException):
+    # not an Exception, so that solutions can't swallow it by accident
+    pass
+
+
+def _raise_alarm(signum, frame):
+    raise _Alarm
+
+
+def jobs(days, parts):
+    return [(day, part) for day in days for part in parts]
+
+
+def default_days():
+    return [day for day in aoc_days.DAYS if aoc_days.input_path(day).exists()]
+
+
+def attempt(day, part, input, timeout=None):
+    """
+    Solve one part, and return the answer with the time it took.
+
+    If a timeout is given, the solution is interrupted with TimeoutError
+    once it has used up that many seconds of wall-clock time. This is
+    done with a signal, which can't interrupt a solution busy in C code,
+    so parallel runs enforce their budgets from outside, by killing the
+    worker process instead (see aoc.schedule).
+    """
+    if timeout is not None:
+        handler = signal.signal(signal.SIGALRM, _raise_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        start = time.perf_counter()
+        answer = aoc_days.solve(day, part, input)
+        elapsed = time.perf_counter() - start
+    except _Alarm:
+        raise TimeoutError(
+            f'day {day:02} part {part} exceeded its budget of {timeout}s'
+        ) from None
+    finally:
+        if timeout is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, handler)
+    return answer, elapsed
+
+
+def finish(stats, day, part, outcome, timeout=None):
+    """
+    Report the outcome of attempt(), or the exception it raised.
+
+    An elapsed time of None stands for an answer found in the cache.
+    Returns True if the job failed.
+    """
+    if isinstance(outcome, NotImplementedError):
+        print(f'# day {day:02} part {part} is not implemented')
+        return False
+    elif isinstance(outcome, TimeoutError):
+        print(f'# {outcome}', file=sys.stderr)
+        aoc_stats.record(stats, day, part, seconds=timeout)
+        return True
+    elif isinstance(outcome, Exception):
+        print(f'# day {day:02} part {part} failed: {outcome!r}',
+              file=sys.stderr)
+        return True
+    answer, elapsed = outcome
+    aoc_days.write_output(day, part, answer)
+    if elapsed is None:
+        print(f'# day {day:02} part {part} (cached)')
+    else:
+        aoc_stats.record(stats, day, part, seconds=elapsed)
+        print(f'# day {day:02} part {part} ({elapsed:.3f}s)')
+    print(answer)
+    return False
+
+
+def run(jobs, timeout=None, cache=None, phases=None, memory=False):
+    """
+    Solve each (day, part) in turn, and return how many of them failed.
+
+    Answers are looked up in, and added to, the cache if one is given.
+    If a phases dictionary is given, the phases recorded by the aoc
+    instrument module are reported for each part, and stored there.
+    With memory set, the peak memory of each part and the lines which
+    allocated it are reported, and recorded in stats.json.
+    """
+    stats = aoc_stats.load()
+    # timings taken under tracemalloc would mislead the scheduler
+    timings = {} if phases is not None or memory else stats
+    failed = 0
+    inputs = {}
+    for day, part in jobs:
+        usage = {}
+        try:
+            if day not in inputs:
+                aoc_days.load(day)
+                inputs[day] = aoc_days.load_input(day)
+            answer = None
+            if cache is not None:
+                key = aoc_cache.key(day, part, inputs[day])
+                answer = cache.get(key)
+            if answer is not None:
+                outcome = (answer, None)
+            else:
+                with contextlib.ExitStack() as stack:
+                    if memory:
+                        usage = stack.enter_context(aoc_memory.tracking())
+                    stack.enter_context(instrument.phase('solve'))
+                    outcome = attempt(day, part, inputs[day], timeout)
+                if cache is not None:
+                    cache.put(key, str(outcome[0]))
+        except Exception as e:
+            outcome = e
+        failed += finish(timings, day, part, outcome, timeout)
+        if phases is not None:
+            phases[aoc_stats.key(day, part)] = recorded = instrument.collect()
+            print(instrument.table(recorded))
+        if memory and usage:
+            aoc_stats.record(stats, day, part, **usage)
+            print(aoc_memory.table(usage))
+    aoc_stats.save(stats)
+    return failed
+
+
+def main(args):
+    days = args.days or default_days()
+    parts = args.part or aoc_days.PARTS
+    cache = None if args.no_cache else aoc_cache.Cache()
+    if args.snapshots:
+        snapshot.enable()
+    if args.phases or args.phases_json:
+        # this has to happen before the solutions are imported
+        instrument.enable()
+        tracemalloc.start()
+        phases = {}
+        failed = run(jobs(days, parts), args.timeout, None, phases)
+        if args.phases_json:
+            with open(args.phases_json, 'w') as f:
+                json.dump(phases, f, indent=1)
+    elif args.memory:
+        failed = run(jobs(days, parts), args.timeout, None, memory=True)
+    elif args.jobs is None:
+        failed = run(jobs(days, parts), args.timeout, cache)
+    else:
+        from aoc import schedule
+        failed = schedule.run(
+            jobs(days, parts), args.jobs or None, args.timeout, cache)
+    return 1 if failed else 0
@@ -0,0 +1,149 @@
+"""
+A sampling profiler, to find out where the time goes in a solution.
+
+While the profiled function runs, a thread wakes up every INTERVAL
+seconds and records the call stack of the thread running it. Unlike
+cProfile, this costs next to nothing per call, so that the profile of
+a solution making millions of small calls isn't distorted.
+
+The stacks are written in the collapsed format which flame graph tools
+such as flamegraph.pl, inferno or speedscope read, one line per distinct
+stack from the outermost call to the innermost, with its sample count,
+and summed up per function in a table of the hottest ones.
+
+>>> def spin(n):
+...     return sum(i * i for i in range(n))
+>>> answer, samples = profile(spin, 3_000_000)
+>>> sum(samples.values()) > 0
+True
+>>> print(collapsed({('f', 'g'): 3, ('f',): 1}))
+f 1
+f;g 3
+>>> print(table({('f', 'g'): 3, ('f',): 1}))
+   self %  total %   function
+     75.0     75.0   g
+     25.0    100.0   f
+"""
+
+import collections
+import os
+import sys
+import threading
+import time
+
+from aoc import days as aoc_days
+
+# how often to sample, in seconds
+INTERVAL = 0.001
+# how many functions to list by default
+TOP = 20
+
+
+def label(code):
+    path = os.path.abspath(code.co_filename)
+    if path.startswith(f'{aoc_days.ROOT}{os.sep}'):
+        path = os.path.relpath(path, aoc_days.ROOT)
+    return f'{code.co_qualname} ({path}:{code.co_firstlineno})'
+
+
+def profile(func, *args, interval=INTERVAL, **kwargs):
+    """
+    Call a function, sampling its call stacks as it runs.
+
+    Returns its result, and a Counter of the stacks, as tuples of labels
+    from the outermost call to the innermost.
+    """
+    counts = collections.Counter()
+    target = threading.get_ident()
+    base = sys._getframe()
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target)
+            stack = []
+            # leave out the frames outside of the profiled function
+            while frame is not None and frame is not base:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            if frame is base and stack:
+                counts[tuple(reversed(stack))] += 1
+
+    # the sampler can only run once the profiled thread lets go of the
+    # GIL, which by default it only has to every 5ms
+    switch = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch, interval))
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        done.set()
+        sampler.join()
+        sys.setswitchinterval(switch)
+
+    labels = {}
+    samples = collections.Counter()
+    for stack, count in counts.items():
+        samples[tuple(
+            labels.setdefault(code, label(code)) for code in stack
+        )] += count
+    return result, samples
+
+
+def collapsed(samples):
+    """
+    The stacks in the collapsed format, one line per stack.
+    """
+    return '\n'.join(
+        f'{";".join(stack)} {count}'
+        for stack, count in sorted(samples.items())
+    )
+
+
+def table(samples, top=TOP):
+    """
+    The functions where most samples were taken, either in the function
+    itself or in the functions it called, with their share of samples.
+    """
+    total = sum(samples.values())
+    own = collections.Counter()
+    inclusive = collections.Counter()
+    for stack, count in samples.items():
+        own[stack[-1]] += count
+        for function in set(stack):
+            inclusive[function] += count
+    hottest = sorted(
+        inclusive, key=lambda f: (own[f], inclusive[f]), reverse=True)
+    lines = [f'{"self %":>9} {"total %":>8}   function']
+    for function in hottest[:top]:
+        lines.append(
+            f'{100 * own[function] / total:>9.1f} '
+            f'{100 * inclusive[function] / total:>8.1f}   {function}'
+        )
+    return '\n'.join(lines)
+
+
+def main(args):
+    day, part = args.day, args.part
+    if args.size is None:
+        input = aoc_days.load_input(day)
+    else:
+        from aoc.bench import generate
+        input = generate.generate(day, args.size, args.seed)
+    aoc_days.load(day)
+    start = time.perf_counter()
+    answer, samples = profile(
+        aoc_days.solve, day, part, input, interval=args.interval)
+    elapsed = time.perf_counter() - start
+    print(f'# day {day:02} part {part} ({elapsed:.3f}s, '
+          f'{sum(samples.values())} samples)')
+    print(answer)
+    print(table(samples, args.top))
+    output = args.output or (
+        aoc_days.ROOT / '.cache' / 'profiles' / f'{day:02}.{part}.folded')
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        print(collapsed(samples), file=f)
+    print(f'# collapsed stacks written to {output}')
+    return 0
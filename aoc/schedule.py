@@ -0,0 +1,163 @@
+"""
+Run (day, part) jobs in parallel, each in a worker process of its own.
+
+The jobs which took longest on previous runs, according to stats.json,
+are dispatched first, so that the few slow days start right away while
+the fast ones fill in the gaps; jobs without a recorded timing count as
+slowest. Each job runs under its own wall-clock budget, which is kept
+by this process rather than the worker: a worker still running at its
+deadline is killed, even if it is stuck in C code where no signal
+handler could interrupt it, and the job is reported as over budget.
+
+>>> order([(1, 1), (16, 1), (20, 1), (3, 2)], {
+...     '01.1': {'seconds': 0.001},
+...     '16.1': {'seconds': 1.5},
+...     '20.1': {'seconds': 0.3},
+... })
+[(3, 2), (16, 1), (20, 1), (1, 1)]
+"""
+
+import multiprocessing
+import os
+import time
+from multiprocessing import connection
+
+from aoc import cache as aoc_cache
+from aoc import days as aoc_days
+from aoc import runner
+from aoc import stats as aoc_stats
+
+
+def order(jobs, stats):
+    return sorted(
+        jobs,
+        key=lambda job: aoc_stats.expected(stats, *job),
+        reverse=True,
+    )
+
+
+def work(day, part, input=None):
+    if input is None:
+        input = aoc_days.load_input(day)
+    return runner.attempt(day, part, input)
+
+
+def _worker(send, day, part, input):
+    try:
+        outcome = work(day, part, input)
+    except Exception as e:
+        outcome = e
+    try:
+        send.send(outcome)
+    except Exception:
+        # the answer, or the exception raised by the solution may not pickle
+        send.send(RuntimeError(repr(outcome)))
+    send.close()
+
+
+class Job:
+    """
+    One part being solved in a worker process of its own, on the given
+    input or else on its input.txt, which the worker reads by itself.
+    """
+
+    def __init__(self, day, part, timeout, input=None):
+        self.day, self.part = day, part
+        self.recv, send = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.Process(
+            target=_worker, args=(send, day, part, input), daemon=True)
+        self.process.start()
+        # so that recv() sees the end of the pipe if the worker dies
+        send.close()
+        self.deadline = None
+        if timeout is not None:
+            self.deadline = time.monotonic() + timeout
+
+    def outcome(self):
+        try:
+            outcome = self.recv.recv()
+        except EOFError:
+            self.process.join()
+            outcome = RuntimeError(
+                f'worker exited with code {self.process.exitcode}')
+        self.close()
+        return outcome
+
+    def kill(self, timeout):
+        self.process.kill()
+        self.close()
+        return TimeoutError(
+            f'day {self.day:02} part {self.part} exceeded its budget of '
+            f'{timeout}s')
+
+    def close(self):
+        self.process.join()
+        self.process.close()
+        self.recv.close()
+
+
+def solve(jobs, workers=None, timeout=None):
+    """
+    Solve the jobs, at most `workers` at a time, and yield each one's
+    (day, part) with the outcome of runner.attempt() as they finish:
+    the answer and the time it took, or the exception it raised.
+    """
+    workers = workers or os.cpu_count() or 1
+    waiting = list(reversed(jobs))
+    running = {}
+    try:
+        while waiting or running:
+            while waiting and len(running) < workers:
+                job = Job(*waiting.pop(), timeout)
+                running[job.recv] = job
+            deadlines = [
+                job.deadline for job in running.values()
+                if job.deadline is not None]
+            wait = None
+            if deadlines:
+                wait = max(0, min(deadlines) - time.monotonic())
+            for recv in connection.wait(list(running), wait):
+                job = running.pop(recv)
+                yield (job.day, job.part), job.outcome()
+            now = time.monotonic()
+            for recv, job in list(running.items()):
+                if job.deadline is not None and job.deadline <= now:
+                    del running[recv]
+                    yield (job.day, job.part), job.kill(timeout)
+    finally:
+        for job in running.values():
+            job.process.kill()
+            job.close()
+
+
+def run(jobs, workers=None, timeout=None, cache=None):
+    """
+    Solve all the jobs, and return how many of them failed.
+
+    Jobs whose answers are in the cache, if one is given, are not sent
+    to the workers at all.
+    """
+    stats = aoc_stats.load()
+    failed = 0
+    keys = {}
+    if cache is not None:
+        pending = []
+        for day, part in jobs:
+            try:
+                input = aoc_days.load_input(day)
+                keys[day, part] = aoc_cache.key(day, part, input)
+            except Exception as e:
+                failed += runner.finish(stats, day, part, e)
+                continue
+            answer = cache.get(keys[day, part])
+            if answer is None:
+                pending.append((day, part))
+            else:
+                runner.finish(stats, day, part, (answer, None))
+        jobs = pending
+    for (day, part), outcome in solve(order(jobs, stats), workers, timeout):
+        if cache is not None and not isinstance(outcome, Exception):
+            cache.put(keys[day, part], str(outcome[0]))
+        failed += runner.finish(stats, day, part, outcome, timeout)
+    aoc_stats.save(stats)
+    return failed
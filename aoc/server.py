@@ -0,0 +1,282 @@
+"""
+A server which keeps the solutions imported, for tools which solve many
+inputs and can't afford to start an interpreter for each of them.
+
+Clients connect to a Unix socket and send requests as lines of JSON:
+
+    {"id": 1, "day": 1, "part": 2, "input": "...", "timeout": 10}
+
+where only the id and timeout are optional. Each request gets a line of
+JSON back as soon as it is solved, which needn't be in the order in which
+the requests were sent, so several of them can be in flight at once:
+
+    {"id": 1, "answer": "45000", "seconds": 0.002, "latency": 0.003}
+
+or {"id": 1, "error": "..."}, where seconds is the time spent solving and
+latency the time since the request arrived. The request {"stats": true}
+gets the number of pending requests and latency statistics instead.
+
+Parts which took longer than HEAVY seconds on previous runs, according to
+stats.json, or which never ran, are solved on a pool of worker processes,
+and so are requests whose input is longer than LARGE characters, since
+those timings are for input.txt. The others are solved by the server
+process itself, in between requests. The workers import the solutions of
+the days they may be sent up front, and any other ones when first sent.
+
+A request with a timeout is held to it by the server rather than by the
+solution: if it is sent to the workers, it is solved instead in a process
+of its own (see aoc.schedule), which the server kills at the deadline,
+even if the solution is stuck in C code where no signal can reach it.
+
+>>> import math
+>>> server = Server(heavy=math.inf)
+>>> asyncio.run(server.respond({'id': 7, 'day': 1, 'part': 1,
+...                             'input': '1\\n2\\n\\n4\\n'}))['answer']
+'4'
+>>> asyncio.run(server.respond({'day': 1}))['error']
+"ValueError: missing field: 'part'"
+>>> server.status()['served']
+2
+"""
+
+import asyncio
+import collections
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import signal
+import socket
+import statistics
+import time
+
+from aoc import days as aoc_days
+from aoc import runner
+from aoc import schedule
+from aoc import stats as aoc_stats
+
+# parts expected to take longer than this many seconds go to the workers
+HEAVY = 0.05
+# and so do inputs longer than this, whatever the part, as the expected
+# times are for input.txt, which is a few tens of kilobytes
+LARGE = 1 << 20
+# how many of the latest latencies to keep statistics on
+WINDOW = 1000
+# the longest request line accepted, inputs included
+LIMIT = 1 << 28
+
+
+def preload(days=aoc_days.DAYS):
+    for day in days:
+        try:
+            aoc_days.load(day)
+        except ValueError:
+            pass
+
+
+def solve(day, part, input, timeout=None):
+    answer, elapsed = runner.attempt(day, part, input, timeout)
+    return str(answer), elapsed
+
+
+async def readable(fd, timeout=None):
+    """
+    Wait for a file descriptor to be readable, and return whether it is,
+    which it isn't if the timeout elapsed first.
+    """
+    loop = asyncio.get_running_loop()
+    ready = asyncio.Event()
+    loop.add_reader(fd, ready.set)
+    try:
+        await asyncio.wait_for(ready.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        loop.remove_reader(fd)
+    return ready.is_set()
+
+
+class Server:
+    def __init__(self, workers=None, heavy=HEAVY, large=LARGE):
+        preload()
+        self.stats = aoc_stats.load()
+        self.heavy = heavy
+        self.large = large
+        # the workers only need the days they are going to solve
+        days = [
+            day for day in aoc_days.DAYS
+            if any(self.is_heavy(day, part) for part in aoc_days.PARTS)
+        ]
+        self.pool = ProcessPoolExecutor(
+            workers, initializer=preload, initargs=(days,))
+        # as many processes for the requests with a timeout as workers
+        self.apart = asyncio.Semaphore(workers or os.cpu_count() or 1)
+        self.pending = 0
+        self.served = 0
+        self.latencies = collections.deque(maxlen=WINDOW)
+
+    def status(self):
+        latencies = sorted(self.latencies)
+        status = {'pending': self.pending, 'served': self.served}
+        if latencies:
+            status['latency'] = {
+                'mean': statistics.fmean(latencies),
+                'p50': latencies[len(latencies) // 2],
+                'p95': latencies[len(latencies) * 95 // 100],
+                'max': latencies[-1],
+            }
+        return status
+
+    def is_heavy(self, day, part):
+        return aoc_stats.expected(self.stats, day, part) > self.heavy
+
+    async def solve(self, day, part, input, timeout=None):
+        if self.is_heavy(day, part) or len(input) > self.large:
+            if timeout is not None:
+                return await self.solve_apart(day, part, input, timeout)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.pool, solve, day, part, input, timeout)
+        # let the other requests in before blocking on this one
+        await asyncio.sleep(0)
+        return solve(day, part, input, timeout)
+
+    async def solve_apart(self, day, part, input, timeout):
+        # a worker of the pool can't be killed on its own, so this one
+        # gets a process which can
+        async with self.apart:
+            job = schedule.Job(day, part, timeout, input)
+            try:
+                done = await readable(job.recv.fileno(), timeout)
+            except BaseException:
+                # cancelled, as the server is shutting down
+                job.kill(timeout)
+                raise
+            outcome = job.outcome() if done else job.kill(timeout)
+        if isinstance(outcome, Exception):
+            raise outcome
+        answer, elapsed = outcome
+        return str(answer), elapsed
+
+    async def respond(self, request):
+        """
+        The response to a request, already decoded from JSON.
+        """
+        start = time.perf_counter()
+        response = {'id': request.get('id')}
+        if request.get('stats'):
+            return response | self.status()
+        self.pending += 1
+        try:
+            try:
+                day, part, input = (
+                    request[field] for field in ('day', 'part', 'input'))
+            except KeyError as e:
+                raise ValueError(f'missing field: {e}') from None
+            answer, elapsed = await self.solve(
+                int(day), int(part), input, request.get('timeout'))
+            response.update(answer=answer, seconds=elapsed)
+        except Exception as e:
+            response['error'] = f'{type(e).__name__}: {e}'
+        finally:
+            self.pending -= 1
+        self.served += 1
+        latency = time.perf_counter() - start
+        self.latencies.append(latency)
+        response['latency'] = latency
+        return response
+
+    async def reply(self, line, writer, lock):
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError('request is not an object')
+        except ValueError as e:
+            response = {'id': None, 'error': f'invalid request: {e}'}
+        else:
+            response = await self.respond(request)
+        async with lock:
+            writer.write(json.dumps(response).encode() + b'\n')
+            await writer.drain()
+
+    async def connected(self, reader, writer):
+        lock = asyncio.Lock()
+        replies = set()
+        try:
+            while line := await reader.readline():
+                reply = asyncio.create_task(self.reply(line, writer, lock))
+                replies.add(reply)
+                reply.add_done_callback(replies.discard)
+            await asyncio.gather(*replies)
+        except (ConnectionError, ValueError):
+            # the client went away, or sent a line over the limit
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if os.path.exists(path):
+            os.unlink(path)
+        server = await asyncio.start_unix_server(
+            self.connected, path, limit=LIMIT)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            os.unlink(path)
+            self.pool.shutdown(cancel_futures=True)
+
+
+def submit(requests, path):
+    """
+    Send requests to a running server, and yield its responses as they
+    arrive.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(os.fspath(path))
+        with sock.makefile('rwb') as f:
+            count = 0
+            for request in requests:
+                f.write(json.dumps(request).encode() + b'\n')
+                count += 1
+            f.flush()
+            for _ in range(count):
+                yield json.loads(f.readline())
+
+
+def main(args):
+    if args.command == 'serve':
+        print(f'# serving on {args.socket}', flush=True)
+        asyncio.run(Server(args.workers).serve(args.socket))
+        return 0
+    if args.stats:
+        requests = [{'stats': True}]
+    else:
+        days = args.days or runner.default_days()
+        parts = args.part or aoc_days.PARTS
+        requests = [
+            {
+                'id': f'{day:02}.{part}',
+                'day': day,
+                'part': part,
+                'input': aoc_days.read_input(day),
+                'timeout': args.timeout,
+            }
+            for day, part in runner.jobs(days, parts)
+        ]
+    failed = 0
+    for response in submit(requests, args.socket):
+        if 'error' in response:
+            failed += 1
+            print(f'# {response["id"]} failed: {response["error"]}')
+        elif 'answer' in response:
+            print(f'# {response["id"]} ({response["seconds"]:.3f}s, '
+                  f'{response["latency"]:.3f}s in all)')
+            print(response['answer'])
+        else:
+            print(json.dumps(response, indent=1))
+    return 1 if failed else 0
@@ -0,0 +1,144 @@
+"""
+Opt-in cache of parsed inputs, so that both parts and later runs can
+skip parsing the same input again.
+
+Parsers which return plain data opt in with the cached() decorator:
+
+    @snapshot.cached
+    def parse(input):
+        ...
+
+Once enabled, each result is pickled next to the solution, into a file
+named after the parser and a hash of its arguments and of the source
+files that aoc.cache.key() also depends on. Later calls with the same
+arguments unpickle a fresh copy instead of parsing, so results which
+the solutions go on to modify are safe to cache. Results which can't
+be pickled are simply not cached, and neither are calls with arguments
+other than strings, bytes and numbers: a file or an iterator of lines
+doesn't tell what it holds without being used up.
+
+>>> import tempfile
+>>> calls = []
+>>> @cached
+... def parse(input):
+...     calls.append(input)
+...     return [int(line) for line in input.splitlines()]
+>>> enable(tempfile.mkdtemp())
+>>> parse('1\\n2\\n').append(3)
+>>> parse('1\\n2\\n'), calls
+([1, 2], ['1\\n2\\n'])
+>>> @cached
+... def count(lines):
+...     return sum(1 for line in lines)
+>>> path = Path(tempfile.mkdtemp()) / 'input.txt'
+>>> _ = path.write_text('1\\n')
+>>> with open(path) as f:
+...     count(f)
+1
+>>> _ = path.write_text('1\\n2\\n')
+>>> with open(path) as f:
+...     count(f)
+2
+"""
+
+import functools
+import os
+from pathlib import Path
+import sys
+
+from aoc import days as aoc_days
+
+_enabled = False
+_directory = None
+_memory = {}
+
+
+def enable(directory=None):
+    """
+    Start caching parsed inputs, by default next to each solution.
+    """
+    global _enabled, _directory
+    _enabled = True
+    _directory = directory
+
+
+def _encode(arg):
+    # only values which stand for their whole contents can be hashed
+    if isinstance(arg, bytes):
+        return b'b' + arg
+    elif isinstance(arg, str):
+        return b's' + arg.encode()
+    elif arg is None or isinstance(arg, (int, float)):
+        return b'r' + repr(arg).encode()
+    return None
+
+
+def _digest(func, args, kwargs):
+    """
+    Hash the arguments and the solution's sources, or return None if any
+    of the arguments can't be hashed by value.
+    """
+    import hashlib
+    from aoc import cache as aoc_cache
+    encoded = [_encode(arg) for arg in args]
+    for name, value in sorted(kwargs.items()):
+        encoded += [_encode(name), _encode(value)]
+    if None in encoded:
+        return None
+    h = hashlib.sha256()
+    module = sys.modules.get(func.__module__)
+    for source in aoc_cache.sources(module) if module else []:
+        h.update(Path(source).read_bytes())
+    for arg in encoded:
+        h.update(f'{len(arg)}:'.encode())
+        h.update(arg)
+    return h.hexdigest()[:16]
+
+
+def _load(path):
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _store(path, data):
+    aoc_days.write_atomically(path, data)
+    # only keep the latest snapshot of each parser
+    for old in path.parent.glob(path.name.rsplit('-', 1)[0] + '-*.pickle'):
+        if old != path:
+            old.unlink(missing_ok=True)
+
+
+def cached(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        # imported here, so that solutions which never enable snapshots
+        # don't pay for them
+        import pickle
+        digest = _digest(func, args, kwargs)
+        if digest is None:
+            return func(*args, **kwargs)
+        directory = Path(
+            _directory or os.path.dirname(func.__code__.co_filename))
+        path = directory / f'parsed-{func.__qualname__}-{digest}.pickle'
+        memo = (func.__module__, func.__qualname__)
+        if memo in _memory and _memory[memo][0] == digest:
+            data = _memory[memo][1]
+        else:
+            data = _load(path)
+        if data is None:
+            result = func(*args, **kwargs)
+            try:
+                data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError,
+                    RecursionError):
+                return result
+            _store(path, data)
+            _memory[memo] = (digest, data)
+            return result
+        _memory[memo] = (digest, data)
+        return pickle.loads(data)
+    return wrapper
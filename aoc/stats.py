@@ -0,0 +1,49 @@
+"""
+Measurements recorded by previous runs, kept in stats.json.
+
+Each (day, part) has a record such as {"seconds": 0.25}, which later
+runs use to decide in which order to schedule the jobs. Runs with
+--memory add the "peak" memory in bytes, and the "top" source lines
+which allocated most of it as [line, bytes] pairs.
+
+>>> stats = {}
+>>> record(stats, 16, 2, seconds=1.5)
+>>> stats
+{'16.2': {'seconds': 1.5}}
+>>> expected(stats, 16, 2), expected(stats, 1, 1)
+(1.5, inf)
+"""
+
+import json
+import math
+
+from aoc.days import ROOT, write_atomically
+
+PATH = ROOT / 'stats.json'
+
+
+def key(day, part):
+    return f'{day:02}.{part}'
+
+
+def load(path=PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save(stats, path=PATH):
+    write_atomically(path, json.dumps(stats, indent=1, sort_keys=True))
+
+
+def record(stats, day, part, **fields):
+    stats.setdefault(key(day, part), {}).update(fields)
+
+
+def expected(stats, day, part):
+    """
+    The recorded running time, or infinity if there is none yet.
+    """
+    return stats.get(key(day, part), {}).get('seconds', math.inf)
@@ -8,10 +8,36 @@ Advent of Code 2022 -- Day 1
 45000
 >>> list(elves(TEST_INPUT))
 [6000, 4000, 11000, 24000, 10000]
+>>> part1(iter(TEST_INPUT.splitlines(keepends=True)))
+24000
+>>> top(iter(TEST_INPUT.splitlines()), 4, chunk_size=8, workers=1)
+[24000, 11000, 10000, 6000]
+>>> top(TEST_INPUT, 2)
+[24000, 11000]
+>>> top(TEST_INPUT, 4, chunk_size=8, workers=2)
+[24000, 11000, 10000, 6000]
+>>> import numpy as np
+>>> data = np.frombuffer(TEST_INPUT.encode(), dtype=np.uint8)
+>>> calories(data).tolist()
+[6000, 4000, 11000, 24000, 10000]
+>>> top(data, 3, chunk_size=8, workers=1)
+[24000, 11000, 10000]
+>>> top(data, 4, chunk_size=8, workers=2)
+[24000, 11000, 10000, 6000]
+>>> part1(data[:0])
+0
 """
 
+from collections import deque
+import heapq
+import itertools as it
+import os
 import sys
 
+from aoc import days as aoc_days
+from aoc import instrument
+from aoc import parsing
+
 TEST_INPUT = """\
 1000
 2000
@@ -29,10 +55,19 @@ TEST_INPUT = """\
 10000
 """
 
+# characters of input per chunk, the chunks being shared out between
+# worker processes when there are several of them
+CHUNK_SIZE = 1 << 24
+# bytes of input per chunk on the NumPy path, which needs several
+# integers of temporary storage per byte, shared out in the same way
+ARRAY_CHUNK_SIZE = 1 << 22
+NEWLINE = ord('\n')
 
+
+@instrument.timed('parse')
 def elves(input):
     calories = 0
-    for line in input.splitlines():
+    for line in parsing.lines(input):
         if line:
             calories += int(line)
         else:
@@ -41,16 +76,163 @@ def elves(input):
     yield calories
 
 
+@instrument.timed('parse')
+def totals(text):
+    """
+    The calories carried by each elf, in a text made of whole groups.
+    """
+    return [sum(map(int, group.split())) for group in text.split('\n\n')]
+
+
+def top_totals(text, k):
+    return heapq.nlargest(k, totals(text))
+
+
+def top_calories(data, k):
+    # NumPy is slow to import, and only needed on this path
+    import numpy as np
+    totals = calories(data)
+    if len(totals) > k:
+        totals = np.partition(totals, -k)[-k:]
+    return heapq.nlargest(k, totals.tolist())
+
+
+def solve_chunks(function, chunks, k, workers):
+    # imported here, as it pulls in multiprocessing and logging, which
+    # take longer to import than the rest of the solution
+    from concurrent.futures import ProcessPoolExecutor
+    # a few chunks at a time, so as to only hold a few of them in memory
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            if len(pending) == 2 * workers:
+                yield pending.popleft().result()
+            # the workers may not be able to import this module as
+            # day01, if they were spawned rather than forked
+            pending.append(
+                pool.submit(aoc_days.call, 1, function.__name__, chunk, k))
+        for future in pending:
+            yield future.result()
+
+
+def calories(data):
+    """
+    The calories carried by each elf, as an array, from an array of the
+    bytes of a text made of whole groups.
+
+    The numbers are converted all at once, by weighing each digit by the
+    power of ten of its place in its line, and then summed up per elf.
+    """
+    import numpy as np
+    if not len(data):
+        # like an empty text, a single elf carrying nothing
+        return np.zeros(1, dtype=np.int64)
+    if data[-1] != NEWLINE:
+        data = np.append(data, np.uint8(NEWLINE))
+    newline = data == NEWLINE
+    digits = data - np.uint8(ord('0'))
+    if np.any((digits > 9) & ~newline):
+        raise ValueError('invalid character in input')
+    digits[newline] = 0
+    ends = np.flatnonzero(newline)
+    place = np.repeat(ends, np.diff(ends, prepend=-1)) - np.arange(len(data))
+    if len(place) and place.max() > 18:
+        raise ValueError('number too large')
+    values = digits * (10 ** np.arange(18, dtype=np.int64))[place - 1]
+    # the groups start after each blank line
+    blank = newline.copy()
+    blank[1:] &= newline[:-1]
+    starts = np.flatnonzero(blank) + 1
+    starts = np.concatenate([[0], starts[starts < len(data)]])
+    return np.add.reduceat(values, starts)
+
+
+def blank_line_after(data, start):
+    """
+    The index just past the first blank line at or after start, or the
+    length of the data if there is none.
+    """
+    import numpy as np
+    size = 1 << 12
+    while start < len(data):
+        window = data[start:start + size + 1]
+        found = np.flatnonzero(
+            (window[:-1] == NEWLINE) & (window[1:] == NEWLINE))
+        if len(found):
+            return start + found[0] + 2
+        start += size
+        size *= 2
+    return len(data)
+
+
+def array_chunks(data, chunk_size=ARRAY_CHUNK_SIZE):
+    """
+    Slices of an array of the bytes of the input, such as a memory-mapped
+    file, each ending with a blank line but the last.
+    """
+    start = 0
+    while start < len(data):
+        end = blank_line_after(data, start + chunk_size)
+        yield data[start:end]
+        start = end
+
+
+def top(input, k, chunk_size=None, workers=None):
+    """
+    The k largest totals, largest first.
+
+    The input, either text or an array of its bytes, is split into
+    chunks at blank lines. If there are several of them, they are shared
+    out between worker processes, and the top totals of each are merged
+    as they come.
+    """
+    if hasattr(input, 'dtype'):
+        function = top_calories
+        chunks = array_chunks(input, chunk_size or ARRAY_CHUNK_SIZE)
+        first = next(chunks, input[:0])
+    else:
+        function = top_totals
+        chunks = parsing.chunks(input, chunk_size or CHUNK_SIZE, sep='\n\n')
+        first = next(chunks, '')
+    second = next(chunks, None)
+    if second is None:
+        return function(first, k)
+    chunks = it.chain([first, second], chunks)
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        results = (function(chunk, k) for chunk in chunks)
+    else:
+        results = solve_chunks(function, chunks, k, workers)
+    best = []
+    for result in results:
+        best = heapq.nlargest(k, best + result)
+    return best
+
+
 def part1(input):
-    return max(elves(input))
+    return top(input, 1)[0]
+
+
+def part2(input, k=3):
+    return sum(top(input, k))
 
 
-def part2(input):
-    return sum(sorted(elves(input))[-3:])
+def read_input(path):
+    """
+    The input as an array of its bytes, memory-mapped so that top() can
+    take the NumPy path without reading it all in, sharing it out between
+    workers a slice at a time. aoc.days.load_input() calls this too, so
+    that the runners take that path.
+    """
+    import numpy as np
+    if not os.path.getsize(path):
+        # there is nothing to map
+        return np.zeros(0, dtype=np.uint8)
+    return np.memmap(path, dtype=np.uint8, mode='r')
 
 
 def main(args):
-    input = open('input.txt').read()
+    input = read_input('input.txt')
     if args == ['1']:
         print(part1(input), file=open('output1.txt', 'w'))
     elif args == ['2']:
@@ -6,60 +6,144 @@ Advent of Code 2022 -- Day 2
 15
 >>> part2(TEST_INPUT)
 12
+>>> scores(TEST_INPUT, SCORING1, SCORING2)
+[15, 12]
 """
 
-import re
 import sys
 
+from aoc import instrument
+from aoc import parsing
+
 TEST_INPUT = """\
 A Y
 B X
 C Z
 """
 
-LINE_RE = re.compile(r'([ABC]) ([XYZ])')
+LINE_RE = parsing.LazyPattern(r'([ABC]) ([XYZ])')
+ROUNDS = [(opponent, response) for opponent in 'ABC' for response in 'XYZ']
+
+SCORING1 = {
+    ('A', 'X'): 1 + 3,
+    ('A', 'Y'): 2 + 6,
+    ('A', 'Z'): 3 + 0,
+    ('B', 'X'): 1 + 0,
+    ('B', 'Y'): 2 + 3,
+    ('B', 'Z'): 3 + 6,
+    ('C', 'X'): 1 + 6,
+    ('C', 'Y'): 2 + 0,
+    ('C', 'Z'): 3 + 3,
+}
+
+SCORING2 = {
+    ('A', 'X'): 3 + 0,
+    ('A', 'Y'): 1 + 3,
+    ('A', 'Z'): 2 + 6,
+    ('B', 'X'): 1 + 0,
+    ('B', 'Y'): 2 + 3,
+    ('B', 'Z'): 3 + 6,
+    ('C', 'X'): 2 + 0,
+    ('C', 'Y'): 3 + 3,
+    ('C', 'Z'): 1 + 6,
+}
+
+
+@instrument.timed('parse')
+def tally(input):
+    """
+    How many times each round comes up in a strategy guide, given as
+    text, bytes, a file opened in either mode, or any other iterable of
+    lines, which is read a chunk at a time.
+
+    Each line is four characters long, so counting the nine valid lines
+    covers a chunk only if there are no other lines in it.
+
+    >>> tally(b'A Y\\nA Y\\nC X')[('A', 'Y')]
+    2
+    >>> tally('A Y\\nB W\\n')
+    Traceback (most recent call last):
+    ...
+    ValueError: invalid line: 'B W'
+    """
+    counts = dict.fromkeys(ROUNDS, 0)
+    text = {round: f'{round[0]} {round[1]}\n' for round in ROUNDS}
+    binary = {round: line.encode() for round, line in text.items()}
+    for chunk in parsing.chunks(input):
+        if isinstance(chunk, bytes):
+            lines, newline = binary, b'\n'
+        else:
+            lines, newline = text, '\n'
+        if not chunk.endswith(newline):
+            chunk += newline
+        found = 0
+        for round, line in lines.items():
+            count = chunk.count(line)
+            counts[round] += count
+            found += count
+        if 4 * found != len(chunk):
+            if isinstance(chunk, bytes):
+                chunk = chunk.decode(errors='replace')
+            parsing.validate(chunk, LINE_RE)
+    return counts
+
+
+def scores(input, *scorings):
+    """
+    The total score according to each scoring, from a single pass over
+    the input.
+    """
+    counts = tally(input)
+    return [
+        sum(scoring[round] * count for round, count in counts.items())
+        for scoring in scorings
+    ]
+
+
+def histogram(input):
+    """
+    How many times each round comes up in a strategy guide, as a 3x3
+    matrix with a row per shape of the opponent and a column per
+    response, from which any number of scorings can be evaluated.
+    """
+    counts = tally(input)
+    return [[counts[opponent, response] for response in 'XYZ']
+            for opponent in 'ABC']
+
+
+def matrix(scoring):
+    """
+    A scoring given as a dict of the points of each round, as a matrix
+    laid out like the histogram.
+    """
+    return [[scoring[opponent, response] for response in 'XYZ']
+            for opponent in 'ABC']
+
 
+def evaluate(histogram, tables):
+    """
+    The total score of a guide with each of the scoring tables, given as
+    an array of 3x3 matrices, by dot products with its histogram.
 
-def score(input, scoring):
-    total = 0
-    for line in input.splitlines():
-        m = LINE_RE.fullmatch(line)
-        if m is None:
-            raise ValueError(f'invalid line: {line!r}')
-        total += scoring[m.groups()]
-    return total
+    >>> tables = [matrix(SCORING1), matrix(SCORING2), [[1] * 3] * 3]
+    >>> evaluate(histogram(TEST_INPUT), tables).tolist()
+    [15, 12, 3]
+    """
+    # NumPy is slow to import, and only worth it for many tables
+    import numpy as np
+    return np.tensordot(np.asarray(tables), np.asarray(histogram), axes=2)
 
 
 def part1(input):
-    return score(input, {
-        ('A', 'X'): 1 + 3,
-        ('A', 'Y'): 2 + 6,
-        ('A', 'Z'): 3 + 0,
-        ('B', 'X'): 1 + 0,
-        ('B', 'Y'): 2 + 3,
-        ('B', 'Z'): 3 + 6,
-        ('C', 'X'): 1 + 6,
-        ('C', 'Y'): 2 + 0,
-        ('C', 'Z'): 3 + 3,
-    })
+    return scores(input, SCORING1)[0]
 
 
 def part2(input):
-    return score(input, {
-        ('A', 'X'): 3 + 0,
-        ('A', 'Y'): 1 + 3,
-        ('A', 'Z'): 2 + 6,
-        ('B', 'X'): 1 + 0,
-        ('B', 'Y'): 2 + 3,
-        ('B', 'Z'): 3 + 6,
-        ('C', 'X'): 2 + 0,
-        ('C', 'Y'): 3 + 3,
-        ('C', 'Z'): 1 + 6,
-    })
+    return scores(input, SCORING2)[0]
 
 
 def main(args):
-    input = open('input.txt').read()
+    input = open('input.txt', 'rb')
     if args == ['1']:
         print(part1(input), file=open('output1.txt', 'w'))
     elif args == ['2']:
@@ -6,11 +6,25 @@ Advent of Code 2022 -- Day 3
 157
 >>> part2(TEST_INPUT)
 70
+>>> overlaps(TEST_INPUT).tolist()
+[16, 38, 42, 22, 20, 19]
+>>> part1(line for line in TEST_INPUT.splitlines())
+157
+>>> badges('ab\\nbc\\ncd\\nde\\n', size=2).tolist()
+[2, 4]
+>>> part2('ab\\nbc\\n', size=3)
+Traceback (most recent call last):
+...
+ValueError: incomplete group: 'ab', 'bc'
 """
 
+import functools
 import string
 import sys
 
+from aoc import instrument
+from aoc import parsing
+
 TEST_INPUT = """\
 vJrwpWtwJgWrhcsFMMfFFhFp
 jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL
@@ -20,39 +34,164 @@ ttgJtRGJQctTZtZT
 CrZsJsPPZsGzwwsLwLmpwMDw
 """
 
-priority = {letter: p for p, letter in enumerate(string.ascii_letters, 1)}
+NEWLINE = ord('\n')
+
+
+@functools.cache
+def bits():
+    """
+    The bit of each byte value, 1 << (priority - 1) for the letters and
+    0 for the others, so that the items of a rucksack make a 52-bit mask.
+    """
+    # imported here, as it takes longer than the rest of the solution
+    import numpy as np
+    table = np.zeros(256, dtype=np.uint64)
+    for bit, letter in enumerate(string.ascii_letters):
+        table[ord(letter)] = 1 << bit
+    return table
+
+
+class Rucksacks:
+    """
+    The rucksacks of a chunk of the input, as the bits of all of its
+    bytes, and the start and end of each line, from which masks are
+    taken in bulk.
+    """
+
+    @instrument.timed('parse')
+    def __init__(self, text):
+        import numpy as np
+        if text and not text.endswith('\n'):
+            text += '\n'
+        self.raw = text.encode()
+        data = np.frombuffer(self.raw, dtype=np.uint8)
+        self.ends = np.flatnonzero(data == NEWLINE)
+        self.starts = np.zeros_like(self.ends)
+        self.starts[1:] = self.ends[:-1] + 1
+        self.bits = bits()[data]
+        invalid = (self.bits == 0) & (data != NEWLINE)
+        if invalid.any():
+            line = np.searchsorted(self.ends, invalid.argmax())
+            raise ValueError(f'invalid rucksack: {self.line(line)!r}')
+
+    def __len__(self):
+        return len(self.ends)
+
+    def line(self, index):
+        return self.raw[self.starts[index]:self.ends[index]].decode()
+
+    def after(self, index):
+        """
+        The text of the lines from the given one on.
+        """
+        if index == len(self):
+            return ''
+        return self.raw[self.starts[index]:].decode()
+
+    def masks(self, bounds):
+        """
+        The mask of the items from each bound to the next, the last one
+        going on to the end of the chunk.
+        """
+        import numpy as np
+        if not len(bounds):
+            return np.zeros(0, dtype=np.uint64)
+        # the bits of the line endings are 0, so that empty ranges, for
+        # which reduceat() takes the item at the bound, have empty masks
+        return np.bitwise_or.reduceat(self.bits, bounds)
+
+
+def priorities(masks, describe):
+    """
+    The priority of the single item in each mask, from its bit length.
+    """
+    import numpy as np
+    single = (masks != 0) & (masks & (masks - np.uint64(1)) == 0)
+    if not single.all():
+        raise ValueError(describe(single.argmin()))
+    # powers of two up to 2**51 are exact as floats, and frexp() gives
+    # their exponent plus one, which is their bit length
+    return np.frexp(masks.astype(np.float64))[1]
+
+
+def _concatenate(arrays):
+    import numpy as np
+    return np.concatenate([np.zeros(0, dtype=np.int32), *arrays])
+
+
+def overlap_chunks(input):
+    """
+    The priority of the item in both compartments of each rucksack, as
+    an array per chunk of the input, so that a stream is read in
+    constant memory.
+    """
+    import numpy as np
+    for chunk in parsing.chunks(input):
+        rucksacks = Rucksacks(chunk)
+        sizes = rucksacks.ends - rucksacks.starts
+        if (sizes % 2).any():
+            line = rucksacks.line((sizes % 2).argmax())
+            raise ValueError(f'unequal compartment sizes: {line!r}')
+        middles = rucksacks.starts + sizes // 2
+        halves = rucksacks.masks(
+            np.stack([rucksacks.starts, middles], 1).ravel())
+        yield priorities(
+            halves[0::2] & halves[1::2],
+            lambda i: f'non-unique overlap: {rucksacks.line(i)!r}',
+        )
+
+
+def overlaps(input):
+    """
+    The priority of the item in both compartments of each rucksack.
+    """
+    return _concatenate(overlap_chunks(input))
+
+
+def badge_chunks(input, size=3):
+    """
+    The priority of the item common to each group of rucksacks, as an
+    array per chunk of the input, the lines of a group left incomplete
+    at the end of a chunk being carried over to the next one.
+    """
+    import numpy as np
+    rest = ''
+    for chunk in parsing.chunks(input):
+        rucksacks = Rucksacks(rest + chunk)
+        complete = len(rucksacks) - len(rucksacks) % size
+        rest = rucksacks.after(complete)
+        # with the start of the incomplete group as a bound too, so that
+        # the masks of the complete ones stop there
+        bounds = rucksacks.starts[:complete + 1]
+        groups = rucksacks.masks(bounds)[:complete].reshape(-1, size)
+
+        def describe(group):
+            lines = range(group * size, (group + 1) * size)
+            return (f'non-unique badge: '
+                    f'{", ".join(repr(rucksacks.line(i)) for i in lines)}')
+        yield priorities(np.bitwise_and.reduce(groups, axis=1), describe)
+    if rest:
+        lines = map(repr, rest.splitlines())
+        raise ValueError(f'incomplete group: {", ".join(lines)}')
+
+
+def badges(input, size=3):
+    """
+    The priority of the item common to each group of rucksacks.
+    """
+    return _concatenate(badge_chunks(input, size))
 
 
 def part1(input):
-    total = 0
-    for rucksack in input.splitlines():
-        size = len(rucksack)
-        if size % 2 != 0:
-            raise ValueError(f'unequal compartment sizes: {rucksack!r}')
-        overlap = set(rucksack[:size//2]) & set(rucksack[size//2:])
-        if len(overlap) != 1:
-            raise ValueError(f'non-unique overlap: {rucksack!r}')
-        total += priority[overlap.pop()]
-    return total
-
-
-def part2(input):
-    total = 0
-    rucksacks = iter(input.splitlines())
-    for first in rucksacks:
-        second = next(rucksacks)
-        third = next(rucksacks)
-        badge = set(first) & set(second) & set(third)
-        if len(badge) != 1:
-            raise ValueError(
-                f'non-unique badge: {first!r}, {second!r}, {third!r}'
-            )
-        total += priority[badge.pop()]
-    return total
+    return sum(int(chunk.sum()) for chunk in overlap_chunks(input))
+
+
+def part2(input, size=3):
+    return sum(int(chunk.sum()) for chunk in badge_chunks(input, size))
 
 
 def main(args):
-    input = open('input.txt').read()
+    input = open('input.txt')
     if args == ['1']:
         print(part1(input), file=open('output1.txt', 'w'))
     elif args == ['2']:
@@ -6,11 +6,36 @@ Advent of Code 2022 -- Day 4
 2
 >>> part2(TEST_INPUT)
 4
+>>> part2(line for line in TEST_INPUT.splitlines())
+4
+
+Questions across pairs go through an index of all the assignments, the
+pair on line i being assignments 2*i and 2*i + 1:
+
+>>> index = IntervalIndex.from_pairs(parse(TEST_INPUT))
+>>> [sorted(found) for found in index.stab([1, 7])]
+[[], [1, 4, 5, 6, 7, 11]]
+>>> [sorted(found) for found in index.overlap([(1, 2), (9, 9)])]
+[[0, 2, 6, 10], [5]]
+>>> index.covered(4)
+7
+>>> index.covered(0)
+Traceback (most recent call last):
+  ...
+ValueError: invalid depth: 0
+>>> contained_pairs(index), overlapping_pairs(index)
+(2, 4)
 """
 
+import bisect
+import collections
 import re
 import sys
 
+from aoc import instrument
+from aoc import parsing
+from aoc import snapshot
+
 TEST_INPUT = """\
 2-4,6-8
 2-3,4-5
@@ -20,42 +45,264 @@ TEST_INPUT = """\
 2-6,4-8
 """
 
-line_re = re.compile(r"""
+line_re = parsing.LazyPattern(r"""
     (0|[1-9][0-9]*)    # 1st number
     -(0|[1-9][0-9]*),  # 2nd number
     (0|[1-9][0-9]*)    # 3rd number
     -(0|[1-9][0-9]*)   # 4th number
 """, re.VERBOSE)
 
+# once the lines are valid, the only characters between the numbers
+BLANKS = str.maketrans('-,\n', '   ')
 
-def parse(input):
-    for line in input.splitlines():
+
+def parse_lines(lines):
+    for line in lines:
         m = line_re.fullmatch(line)
         if m is None:
             raise ValueError(f'invalid line: {line!r}')
-        a, b, c, d = map(int, m.groups())
+        yield tuple(map(int, m.groups()))
+
+
+@instrument.timed('parse')
+def parse(input):
+    if isinstance(input, str):
+        # with the whole input at hand, it's faster to parse it in bulk
+        rows = parsing.records(input, line_re, signed=False)
+    else:
+        rows = parse_lines(parsing.lines(input))
+    for a, b, c, d in rows:
         if not (a <= b and c <= d):
+            line = f'{a}-{b},{c}-{d}'
             raise ValueError(f'invalid ranges: {line!r}')
         yield (a, b, c, d)
 
 
+class _Node:
+    __slots__ = ('center', 'left', 'right', 'by_start', 'by_end')
+
+
+class IntervalIndex:
+    """
+    An index of closed intervals of sections, identified by their
+    position in the list it was built from.
+
+    It is a centered interval tree: each node holds the intervals which
+    span its center, sorted both by start and by end, and the intervals
+    entirely before or after the center go to its two subtrees. Starts
+    are also kept sorted on their own. Either way, stabbing a point or
+    overlapping a range costs O(log n + k) for k intervals found. Which
+    intervals contain a range is found by stabbing its start, and then
+    dropping those that end too soon, so it costs O(log n + s) for the
+    s intervals which contain the start, however few of them are kept.
+    """
+
+    def __init__(self, intervals):
+        self.starts = []
+        self.ends = []
+        for start, end in intervals:
+            if start > end:
+                raise ValueError(f'invalid range: {start}-{end}')
+            self.starts.append(start)
+            self.ends.append(end)
+        self.by_start = sorted(
+            range(len(self.starts)), key=self.starts.__getitem__)
+        self.sorted_starts = [self.starts[i] for i in self.by_start]
+        self.root = self._build(self.by_start)
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        return cls(
+            interval for a, b, c, d in pairs for interval in ((a, b), (c, d))
+        )
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _build(self, ids):
+        # ids come sorted by start, and stay so in the subtrees
+        if not ids:
+            return None
+        starts, ends = self.starts, self.ends
+        endpoints = sorted(
+            point for i in ids for point in (starts[i], ends[i]))
+        node = _Node()
+        node.center = center = endpoints[len(endpoints) // 2]
+        node.by_start = [i for i in ids if starts[i] <= center <= ends[i]]
+        node.by_end = sorted(node.by_start, key=ends.__getitem__,
+                             reverse=True)
+        node.left = self._build([i for i in ids if ends[i] < center])
+        node.right = self._build([i for i in ids if starts[i] > center])
+        return node
+
+    def _stab(self, point):
+        starts, ends = self.starts, self.ends
+        found = []
+        node = self.root
+        while node is not None:
+            if point < node.center:
+                for i in node.by_start:
+                    if starts[i] > point:
+                        break
+                    found.append(i)
+                node = node.left
+            elif point > node.center:
+                for i in node.by_end:
+                    if ends[i] < point:
+                        break
+                    found.append(i)
+                node = node.right
+            else:
+                found.extend(node.by_start)
+                break
+        return found
+
+    def stab(self, points):
+        """
+        The intervals which contain each of the points.
+        """
+        return [self._stab(point) for point in points]
+
+    def overlap(self, ranges):
+        """
+        The intervals which overlap each of the ranges: those which
+        contain its start, and those which start within it.
+        """
+        found = []
+        for start, end in ranges:
+            first = bisect.bisect_right(self.sorted_starts, start)
+            last = bisect.bisect_right(self.sorted_starts, end, lo=first)
+            found.append(self._stab(start) + self.by_start[first:last])
+        return found
+
+    def contain(self, ranges):
+        """
+        The intervals which contain each of the ranges in full.
+        """
+        return [
+            [i for i in self._stab(start) if self.ends[i] >= end]
+            for start, end in ranges
+        ]
+
+    def covered(self, k=1):
+        """
+        The number of sections which at least k intervals contain.
+        """
+        if k < 1:
+            # every section is contained in at least zero intervals
+            raise ValueError(f'invalid depth: {k}')
+        changes = collections.Counter()
+        for start, end in zip(self.starts, self.ends):
+            changes[start] += 1
+            changes[end + 1] -= 1
+        count = depth = 0
+        previous = None
+        for point in sorted(changes):
+            if depth >= k:
+                count += point - previous
+            depth += changes[point]
+            previous = point
+        return count
+
+
+def _firsts(index):
+    return zip(index.starts[0::2], index.ends[0::2])
+
+
+def _seconds(index):
+    return zip(index.starts[1::2], index.ends[1::2])
+
+
+def contained_pairs(index):
+    """
+    The answer to part 1 through an index built with from_pairs().
+    """
+    return sum(
+        2 * i + 1 in first or 2 * i in second
+        for i, (first, second) in enumerate(zip(
+            index.contain(_firsts(index)), index.contain(_seconds(index))))
+    )
+
+
+def overlapping_pairs(index):
+    """
+    The answer to part 2 through an index built with from_pairs().
+    """
+    return sum(
+        2 * i + 1 in found
+        for i, found in enumerate(index.overlap(_firsts(index)))
+    )
+
+
+@instrument.timed('parse')
+def column_chunks(input):
+    """
+    The four endpoints of the pairs, as four arrays for each chunk of the
+    input, so that a stream is read in constant memory.
+
+    >>> [c.tolist() for a, b, c, d in column_chunks(TEST_INPUT)]
+    [[6, 4, 7, 3, 4, 4]]
+    >>> list(column_chunks('2-4,6-8\\n5-4,1-1\\n'))
+    Traceback (most recent call last):
+    ...
+    ValueError: invalid ranges: '5-4,1-1'
+    """
+    # imported here, as it takes longer than the rest of the solution
+    import numpy as np
+    for chunk in parsing.chunks(input):
+        parsing.validate(chunk, line_re)
+        # NumPy reads all the numbers of the chunk in a single scan
+        numbers = np.fromstring(
+            chunk.translate(BLANKS), dtype=np.int64, sep=' ')
+        a, b, c, d = numbers.reshape(-1, 4).T
+        invalid = (a > b) | (c > d)
+        if invalid.any():
+            i = invalid.argmax()
+            line = f'{a[i]}-{b[i]},{c[i]}-{d[i]}'
+            raise ValueError(f'invalid ranges: {line!r}')
+        yield a, b, c, d
+
+
+@snapshot.cached
+def columns(input):
+    """
+    The four endpoints of every pair, as four arrays.
+    """
+    import numpy as np
+    pieces = list(column_chunks(input))
+    if not pieces:
+        return tuple(np.zeros(0, dtype=np.int64) for _ in range(4))
+    return tuple(np.concatenate(column) for column in zip(*pieces))
+
+
+def counts(input):
+    """
+    How many pairs have one range contain the other, and how many have
+    ranges which overlap, from a single parse.
+    """
+    if isinstance(input, str):
+        # the whole input is in memory anyway, and may have a snapshot
+        pieces = [columns(input)]
+    else:
+        pieces = column_chunks(input)
+    contained = overlapping = 0
+    for a, b, c, d in pieces:
+        contained += int((((a <= c) & (d <= b)) | ((c <= a) & (b <= d))).sum())
+        # ranges overlap unless one ends before the other starts
+        overlapping += int(((a <= d) & (c <= b)).sum())
+    return contained, overlapping
+
+
 def part1(input):
-    contained = 0
-    for a, b, c, d in parse(input):
-        contained += (a <= c <= d <= b) or (c <= a <= b <= d)
-    return contained
+    return counts(input)[0]
 
 
 def part2(input):
-    overlapping = 0
-    for a, b, c, d in parse(input):
-        # it's easier to test for NON-overlaps
-        overlapping += not (a <= b < c <= d or c <= d < a <= b)
-    return overlapping
+    return counts(input)[1]
 
 
 def main(args):
-    input = open('input.txt').read()
+    input = open('input.txt')
     if args == ['1']:
         print(part1(input), file=open('output1.txt', 'w'))
     elif args == ['2']:
@@ -6,11 +6,18 @@ Advent of Code 2022 -- Day 5
 'CMZ'
 >>> part2(TEST_INPUT)
 'MCD'
+>>> part1(TEST_INPUT, Rope), part2(TEST_INPUT, Rope)
+('CMZ', 'MCD')
+>>> replay = Replay(TEST_INPUT, one_at_a_time=True, every=2)
+>>> [replay.tops(k) for k in range(len(replay.moves) + 1)]
+['NDP', 'DCP', ' CZ', 'M Z', 'CMZ']
 """
 
 import re
 import sys
 
+from aoc import instrument
+
 TEST_INPUT = """\
     [D]    
 [N] [C]    
@@ -24,7 +31,111 @@ move 1 from 1 to 2
 """  # noqa: W291
 
 
-def parse_drawing(input):
+# how many moves apart Replay takes its checkpoints by default
+CHECKPOINT_EVERY = 100
+
+
+class Rope:
+    """
+    A stack of crates which is moved around by reference rather than by
+    copying the crates, for very tall stacks.
+
+    Its crates are held in segments, from the bottom up, each of which
+    is a tuple shared with other ropes and a range of indices into it.
+    Ranges slice and reverse without copying, so taking crates off the
+    top or reversing them only costs as much as the number of segments
+    involved, whatever the number of crates. It supports the operations
+    of lists which move() needs.
+
+    >>> rope = Rope('ABCDE')
+    >>> top = rope[3:]
+    >>> del rope[3:]
+    >>> top.reverse()
+    >>> rope.extend(top)
+    >>> ''.join(rope), rope[-1], len(rope)
+    ('ABCED', 'D', 5)
+    """
+
+    def __init__(self, crates=()):
+        self.segments = []
+        self.size = 0
+        self.extend(crates)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for crates, indices in self.segments:
+            for i in indices:
+                yield crates[i]
+
+    def __repr__(self):
+        return f'Rope({list(self)!r})'
+
+    def _suffix(self, key):
+        start, stop, step = key.indices(self.size)
+        if stop != self.size or step != 1:
+            raise TypeError('only the top of a rope can be sliced')
+        return min(start, stop)
+
+    def _cut(self, start):
+        # split the segment across the given height, if any, and return
+        # the index of the lowest segment above it
+        height = self.size
+        i = len(self.segments)
+        while height > start:
+            i -= 1
+            height -= len(self.segments[i][1])
+        if height < start:
+            crates, indices = self.segments[i]
+            cut = start - height
+            self.segments[i:i+1] = [
+                (crates, indices[:cut]), (crates, indices[cut:])]
+            i += 1
+        return i
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start = self._suffix(key)
+            top = Rope()
+            top.segments = self.segments[self._cut(start):]
+            top.size = self.size - start
+            return top
+        if key == -1 and self.segments:
+            crates, indices = self.segments[-1]
+            return crates[indices[-1]]
+        return list(self)[key]
+
+    def __delitem__(self, key):
+        start = self._suffix(key)
+        del self.segments[self._cut(start):]
+        self.size = start
+
+    def copy(self):
+        rope = Rope()
+        rope.segments = self.segments.copy()
+        rope.size = self.size
+        return rope
+
+    def reverse(self):
+        self.segments = [
+            (crates, indices[::-1])
+            for crates, indices in reversed(self.segments)
+        ]
+
+    def extend(self, crates):
+        if isinstance(crates, Rope):
+            self.segments.extend(crates.segments)
+            self.size += crates.size
+            return
+        crates = tuple(crates)
+        if crates:
+            self.segments.append((crates, range(len(crates))))
+            self.size += len(crates)
+
+
+@instrument.timed('parse')
+def parse_drawing(input, stack_type=list):
     lines = iter(input.splitlines())
 
     # first line tells us how many stacks
@@ -56,9 +167,13 @@ def parse_drawing(input):
     if line:
         raise ValueError(f'extra drawing line: {line!r}')
 
+    if stack_type is not list:
+        stacks = {
+            label: stack_type(crates) for label, crates in stacks.items()}
     return stacks, lines
 
 
+@instrument.timed('parse')
 def parse_moves(lines):
     move_re = re.compile(r'move (0|[1-9]\d*) from (.) to (.)')
     for line in lines:
@@ -69,27 +184,106 @@ def parse_moves(lines):
         yield int(quantity), source, destination
 
 
-def part1(input):
-    stacks, lines = parse_drawing(input)
-    for quantity, source, destination in parse_moves(lines):
-        for _ in range(int(quantity)):
-            crate = stacks[source].pop()
-            stacks[destination].append(crate)
-    return ''.join(s[-1] for s in stacks.values())
+def move(stacks, quantity, source, destination, one_at_a_time):
+    """
+    Move crates from the top of one stack to the top of another, with
+    slice operations which only touch the crates moved.
+
+    The CrateMover 9000 moves them one at a time, which reverses them,
+    unless it puts them back on the stack it took them from.
+
+    >>> stacks = {'1': list('BA'), '2': list('C')}
+    >>> move(stacks, 2, '1', '1', one_at_a_time=True)
+    >>> ''.join(s[-1] for s in stacks.values())
+    'AC'
+    """
+    stack = stacks[source]
+    remain = len(stack) - quantity
+    if remain < 0:
+        raise ValueError('not enough crates to pick up')
+    if source == destination:
+        return
+    crates = stack[remain:]
+    del stack[remain:]
+    if one_at_a_time:
+        crates.reverse()
+    stacks[destination].extend(crates)
 
 
-def part2(input):
-    stacks, lines = parse_drawing(input)
+def rearrange(input, one_at_a_time, stack_type=list):
+    stacks, lines = parse_drawing(input, stack_type)
     for quantity, source, destination in parse_moves(lines):
-        stack = stacks[source]
-        remain = len(stack) - quantity
-        if remain < 0:
-            raise ValueError('not enough crates to pick up')
-        stacks[source], crates = stack[:remain], stack[remain:]
-        stacks[destination].extend(crates)
+        move(stacks, quantity, source, destination, one_at_a_time)
     return ''.join(s[-1] for s in stacks.values())
 
 
+def copy(stacks):
+    return {label: stack.copy() for label, stack in stacks.items()}
+
+
+class Replay:
+    """
+    The state of the stacks after any number of moves, restored from the
+    latest checkpoint at or before it and brought up to date by replaying
+    the moves since.
+
+    A checkpoint is taken every so many moves, trading the memory of a
+    copy of the stacks for each of them against the time to replay up
+    to that many moves per query. Ropes make the copies cheap, as their
+    segments are shared rather than copied.
+    """
+
+    def __init__(self, input, one_at_a_time, every=CHECKPOINT_EVERY,
+                 stack_type=list):
+        if every < 1:
+            raise ValueError(f'invalid checkpoint interval: {every}')
+        stacks, lines = parse_drawing(input, stack_type)
+        self.moves = list(parse_moves(lines))
+        self.one_at_a_time = one_at_a_time
+        self.every = every
+        self.checkpoints = [copy(stacks)]
+        for count, (quantity, source, destination) in enumerate(
+                self.moves, 1):
+            move(stacks, quantity, source, destination, one_at_a_time)
+            if count % every == 0:
+                self.checkpoints.append(copy(stacks))
+        # the latest state asked for, as a shortcut for the next query
+        self.cursor = 0, copy(self.checkpoints[0])
+
+    def stacks(self, count):
+        """
+        A copy of the stacks after the first count moves.
+        """
+        if not 0 <= count <= len(self.moves):
+            raise ValueError(f'invalid number of moves: {count}')
+        start = count - count % self.every
+        done, stacks = self.cursor
+        if not start <= done <= count:
+            # the checkpoint stays as it is, while the cursor is ours
+            done = start
+            stacks = copy(self.checkpoints[start // self.every])
+        for quantity, source, destination in self.moves[done:count]:
+            move(stacks, quantity, source, destination, self.one_at_a_time)
+        self.cursor = count, stacks
+        return copy(stacks)
+
+    def tops(self, count):
+        """
+        The crates on top of each stack after the first count moves, with
+        a space for stacks which are empty by then.
+        """
+        return ''.join(
+            s[-1] if len(s) else ' ' for s in self.stacks(count).values())
+
+
+def part1(input, stack_type=list):
+    return rearrange(input, one_at_a_time=True, stack_type=stack_type)
+
+
+def part2(input, stack_type=list):
+    return rearrange(input, one_at_a_time=False, stack_type=stack_type)
+
+
 def main(args):
     input = open('input.txt').read()
     if args == ['1']:
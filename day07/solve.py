@@ -23,9 +23,12 @@ Advent of Code 2022 -- Day 7
     - k (file, size=7214296)
 """
 
-import re
 import sys
 
+from aoc import instrument
+from aoc import parsing
+from aoc import snapshot
+
 TEST_INPUT = """\
 $ cd /
 $ ls
@@ -132,14 +135,16 @@ class Dir:
         return '\n'.join(self._str_lines(0))
 
 
-cd_root = re.compile(r'\$ cd /')
-cd_parent = re.compile(r'\$ cd \.\.')
-cd_subdir = re.compile(r'\$ cd (?P<name>.*)')
-ls_cwd = re.compile(r'\$ ls')
-ls_dir = re.compile(r'dir (?P<name>.*)')
-ls_file = re.compile(r'(?P<size>0|[1-9]\d*) (?P<name>.*)')
+cd_root = parsing.LazyPattern(r'\$ cd /')
+cd_parent = parsing.LazyPattern(r'\$ cd \.\.')
+cd_subdir = parsing.LazyPattern(r'\$ cd (?P<name>.*)')
+ls_cwd = parsing.LazyPattern(r'\$ ls')
+ls_dir = parsing.LazyPattern(r'dir (?P<name>.*)')
+ls_file = parsing.LazyPattern(r'(?P<size>0|[1-9]\d*) (?P<name>.*)')
 
 
+@instrument.timed('parse')
+@snapshot.cached
 def parse(input):
     cwd = root = Dir('/')
     lines = iter(input.splitlines())
@@ -10,6 +10,12 @@ Advent of Code 2022 -- Day 8
 
 import sys
 
+import numpy as np
+
+from aoc import grid
+from aoc import instrument
+from aoc import snapshot
+
 TEST_INPUT = """\
 30373
 25512
@@ -18,49 +24,45 @@ TEST_INPUT = """\
 35390
 """
 
+DIGITS = {str(height): height for height in range(10)}
+
 
+@instrument.timed('parse')
+@snapshot.cached
 def parse(input):
-    rows = tuple(
-        tuple(int(tree) for tree in row)
-        for row in input.splitlines()
-    )
-    cols = tuple(zip(*rows, strict=True))
-    return rows, cols
+    return grid.Grid.parse(input).translate(DIGITS, dtype=np.int8)
 
 
 def part1(input):
-    rows, cols = parse(input)
-    visible = len(rows) * len(cols)
-    for x, col in enumerate(cols):
-        for y, row in enumerate(rows):
-            tree = row[x]
-            assert tree == col[y]
-            visible -= (
-                any(t >= tree for t in row[:x])
-                and any(t >= tree for t in row[x+1:])
-                and any(t >= tree for t in col[:y])
-                and any(t >= tree for t in col[y+1:])
-            )
-    return visible
-
-
-def view(ray):
-    tree, *ray = ray
-    result = 0
-    for t in ray:
-        result += 1
-        if t >= tree:
-            break
-    return result
+    trees = parse(input).cells
+    visible = np.zeros(trees.shape, dtype=bool)
+    # look from each side in turn, through rotated views of the grids
+    for turns in range(4):
+        rows = np.rot90(trees, turns)
+        tallest = grid.shift(np.maximum.accumulate(rows, axis=1), (0, 1), -1)
+        np.rot90(visible, turns)[...] |= rows > tallest
+    return int(visible.sum())
+
+
+def view(rows):
+    # how far each tree sees towards the start of its row
+    distance = np.empty(rows.shape, dtype=int)
+    # the column of the last tree at least as tall as each height so far
+    last = np.zeros((len(DIGITS), len(rows)), dtype=int)
+    heights = np.arange(len(DIGITS))[:, None]
+    index = np.arange(len(rows))
+    for col, trees in enumerate(rows.T):
+        distance[:, col] = col - last[trees, index]
+        last[heights <= trees] = col
+    return distance
 
 
 def part2(input):
-    rows, cols = parse(input)
-    return max(
-        view(row[x:]) * view(row[x::-1]) * view(col[y:]) * view(col[y::-1])
-        for x, col in enumerate(cols)
-        for y, row in enumerate(rows)
-    )
+    trees = parse(input).cells
+    score = np.ones(trees.shape, dtype=int)
+    for turns in range(4):
+        np.rot90(score, turns)[...] *= view(np.rot90(trees, turns))
+    return int(score.max())
 
 
 def main(args):
@@ -11,9 +11,11 @@ Advent of Code 2022 -- Day 9
 """
 
 import itertools as it
-import re
 import sys
 
+from aoc import instrument
+from aoc import parsing
+
 TEST_INPUT_1 = """\
 R 4
 U 4
@@ -37,7 +39,7 @@ U 20
 """
 
 
-move_re = re.compile(r'([UDLR]) (0|[1-9]\d*)')
+move_re = parsing.LazyPattern(r'([UDLR]) (0|[1-9]\d*)')
 
 step = {
     'U': lambda p: (p[0], p[1]+1),
@@ -57,12 +59,21 @@ def newtail(head, tail):
     return tail
 
 
-def parse(input):
-    for line in input.splitlines():
+def parse_lines(lines):
+    for line in lines:
         m = move_re.fullmatch(line)
         if m is None:
             raise ValueError(f'invalid move: {line!r}')
-        direction, count = m.groups()
+        yield m.groups()
+
+
+@instrument.timed('parse')
+def parse(input):
+    if isinstance(input, str):
+        moves = parsing.fields(input, move_re, message='invalid move')
+    else:
+        moves = parse_lines(parsing.lines(input))
+    for direction, count in moves:
         yield from it.repeat(direction, int(count))
 
 
@@ -88,7 +99,7 @@ def part2(input):
 
 
 def main(args):
-    input = open('input.txt').read()
+    input = open('input.txt')
     if args == ['1']:
         print(part1(input), file=open('output1.txt', 'w'))
     elif args == ['2']:
@@ -15,15 +15,16 @@ Advent of Code 2022 -- Day 10
 [21, 19, 18, 21, 16, 18]
 """
 
-import re
 import sys
 
-addx_re = re.compile(r'addx (0|-?[1-9]\d*)')
+from aoc import parsing
+
+addx_re = parsing.LazyPattern(r'addx (0|-?[1-9]\d*)')
 
 
 def execute(input):
     x = 1
-    for line in input.splitlines():
+    for line in parsing.lines(input):
         if line == 'noop':
             yield x
         elif m := addx_re.fullmatch(line):
@@ -59,7 +60,7 @@ def part2(input):
 
 
 def main(args):
-    input = open('input.txt').read()
+    input = open('input.txt')
     if args == ['1']:
         print(part1(input), file=open('output1.txt', 'w'))
     elif args == ['2']:
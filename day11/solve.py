@@ -10,9 +10,11 @@ Advent of Code 2022 -- Day 11
 
 from collections import namedtuple
 import math
-import re
 import sys
 
+from aoc import instrument
+from aoc import parsing
+
 TEST_INPUT = """\
 Monkey 0:
   Starting items: 79, 98
@@ -43,19 +45,19 @@ Monkey 3:
     If false: throw to monkey 1
 """
 
-monkey_re = re.compile(
+monkey_re = parsing.LazyPattern(
     r'Monkey (?P<monkey>0|[1-9]\d*):')
-starting_re = re.compile(
+starting_re = parsing.LazyPattern(
     r'  Starting items: (?P<items>(?:0|[1-9]\d*)(?:, (?:0|[1-9]\d*))*)')
-operation_re = re.compile(
+operation_re = parsing.LazyPattern(
     r'  Operation: new = old (?:'
     r'(?P<square>\* old)|'
     r'(?P<op>[+*]) (?P<arg>0|[1-9]\d*))')
-test_re = re.compile(
+test_re = parsing.LazyPattern(
     r'  Test: divisible by (?P<div>[1-9]\d*)')
-true_re = re.compile(
+true_re = parsing.LazyPattern(
     r'    If true: throw to monkey (?P<monkey>0|[1-9]\d*)')
-false_re = re.compile(
+false_re = parsing.LazyPattern(
     r'    If false: throw to monkey (?P<monkey>0|[1-9]\d*)')
 
 Monkey = namedtuple('Monkey', 'items op div next_monkey')
@@ -94,6 +96,7 @@ operation = {
 }
 
 
+@instrument.timed('parse')
 def parse(input):
     lines = iter(input.splitlines())
     monkeys = []
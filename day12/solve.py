@@ -8,9 +8,16 @@ Advent of Code 2022 -- Day 12
 29
 """
 
+from collections import deque
+import functools
 import string
 import sys
-from typing import Optional
+
+import numpy as np
+
+from aoc import grid
+from aoc import instrument
+from aoc import snapshot
 
 TEST_INPUT = """\
 Sabqponm
@@ -20,24 +27,37 @@ acctuvwj
 abdefghi
 """
 
-HEIGHT = {c: i for i, c in enumerate(string.ascii_lowercase)}
-HEIGHT['S'] = HEIGHT['a']
-HEIGHT['E'] = HEIGHT['z']
-
 Point = tuple[int, int]
-Height = dict[Point, int]
-
-
-def parse(input: str) -> tuple[Height, Point, Point]:
-    height = {}
-    start = stop = None
-    for x, line in enumerate(input.splitlines()):
-        for y, char in enumerate(line):
-            height[x, y] = HEIGHT[char]
-            if char == 'S':
-                start = (x, y)
-            elif char == 'E':
-                stop = (x, y)
+
+# the height of the cells around the grid, which can't be climbed onto
+WALL = 255
+
+
+@functools.cache
+def heights() -> dict[str, int]:
+    height = {c: i for i, c in enumerate(string.ascii_lowercase)}
+    height['S'] = height['a']
+    height['E'] = height['z']
+    return height
+
+
+def _flat(padded: grid.Grid, points: np.ndarray) -> list[int]:
+    indices = (np.asarray(points) - padded.origin).T
+    return np.ravel_multi_index(tuple(indices), padded.shape).tolist()
+
+
+def locate(chars: grid.Grid, char: str) -> Point | None:
+    points = chars.points(chars.cells == ord(char))
+    return tuple(points[-1].tolist()) if len(points) else None
+
+
+@instrument.timed('parse')
+@snapshot.cached
+def parse(input: str) -> tuple[grid.Grid, Point, Point]:
+    chars = grid.Grid.parse(input)
+    height = chars.translate(heights())
+    start = locate(chars, 'S')
+    stop = locate(chars, 'E')
     if start is None:
         raise ValueError('missing start')
     if stop is None:
@@ -45,38 +65,49 @@ def parse(input: str) -> tuple[Height, Point, Point]:
     return height, start, stop
 
 
-def bfs(height: Height, start: set[Point], stop: Point) -> int:
+def bfs(height: grid.Grid, start: np.ndarray, stop: Point) -> int:
+    # walled in, the neighbours of a cell are at fixed offsets into the
+    # flattened grid, with no bounds to check
+    padded = height.pad(1, fill=WALL)
+    width = padded.shape[1]
+    # a byte per cell, which indexes as fast as a list
+    heights = padded.cells.astype(np.uint8).tobytes()
+    offsets = (-width, width, -1, 1)
+    goal = _flat(padded, np.array([stop]))[0]
+    visited = bytearray(len(heights))
+    queue = deque()
+    for i in _flat(padded, start):
+        if not visited[i]:
+            visited[i] = True
+            queue.append(i)
     step = 0
-    visited = set()
-    curpos = start
-    while curpos:
-        if stop in curpos:
-            break
+    while queue:
+        for _ in range(len(queue)):
+            i = queue.popleft()
+            if i == goal:
+                return step
+            limit = heights[i] + 1
+            for offset in offsets:
+                j = i + offset
+                if not visited[j] and heights[j] <= limit:
+                    visited[j] = True
+                    queue.append(j)
         step += 1
-        newpos = set()
-        for x, y in curpos - visited:
-            for neighbour in [(x+1, y), (x-1, y), (x, y+1), (x, y-1)]:
-                if height.get(neighbour, float('inf')) <= height[x, y] + 1:
-                    newpos.add(neighbour)
-        visited |= curpos
-        curpos = newpos
-    else:
-        raise ValueError('goal unreachable')
-    return step
+    raise ValueError('goal unreachable')
 
 
 def part1(input: str) -> int:
     height, start, stop = parse(input)
-    return bfs(height, {start}, stop)
+    return bfs(height, np.array([start]), stop)
 
 
 def part2(input: str) -> int:
     height, _, stop = parse(input)
-    start = {xy for xy, h in height.items() if h == HEIGHT['a']}
+    start = height.points(height.cells == heights()['a'])
     return bfs(height, start, stop)
 
 
-def main(args: list[str]) -> Optional[int]:
+def main(args: list[str]) -> int | None:
     input = open('input.txt').read()
     if args == ['1']:
         print(part1(input), file=open('output1.txt', 'w'))
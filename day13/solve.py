@@ -10,6 +10,8 @@ Advent of Code 2022 -- Day 13
 
 import sys
 
+from aoc import instrument
+
 TEST_INPUT = """\
 [1,1,3,1,1]
 [1,1,5,1,1]
@@ -39,6 +41,7 @@ TEST_INPUT = """\
 
 # Matched parentheses is famously a context-free language
 # rather than a regular language, so regexp won't suffice!
+@instrument.timed('parse')
 def parse(line):
     stack = []
     i = 0
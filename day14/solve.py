@@ -8,9 +8,14 @@ Advent of Code 2022 -- Day 14
 93
 """
 
-import re
 import sys
 
+import numpy as np
+
+from aoc import grid
+from aoc import instrument
+from aoc import parsing
+
 TEST_INPUT = """\
 498,4 -> 498,6 -> 496,6
 503,4 -> 502,4 -> 502,9 -> 494,9
@@ -18,9 +23,10 @@ TEST_INPUT = """\
 
 int_re = r'(?:0|[1-9]\d*)'
 point_re = f'{int_re},{int_re}'
-line_re = re.compile(f'{point_re}(?: -> {point_re})*')
+line_re = parsing.LazyPattern(f'{point_re}(?: -> {point_re})*')
 
 
+@instrument.timed('parse')
 def parse(input):
     for line in input.splitlines():
         if not line_re.fullmatch(line):
@@ -43,51 +49,52 @@ def path(points):
     yield src
 
 
-def part1(input):
-    blocks = set()
-    for points in parse(input):
-        blocks.update(path(points))
-    abyss = max(y for (x, y) in blocks)
+def rocks(input):
+    return [point for points in parse(input) for point in path(points)]
+
 
+def part1(input):
+    points = rocks(input)
+    xs = [x for x, y in points]
+    abyss = max(y for x, y in points)
+    # leave room for the sand to fall past the rocks on either side
+    blocks = grid.Grid.from_points(
+        points, (min(xs + [500]) - 1, 0), (max(xs + [500]) + 1, abyss))
+
+    # each grain follows the path of the previous one until it got stuck
     resting = 0
-    while True:
-        x, y = sand = (500, 0)
-        if sand in blocks:
-            raise ValueError('blocked source')
-        while y < abyss:
-            for down in [(x, y+1), (x-1, y+1), (x+1, y+1)]:
-                if down not in blocks:
-                    x, y = sand = down
-                    break
-            else:
+    fall = [(500, 0)]
+    while fall:
+        x, y = fall[-1]
+        if y >= abyss:
+            return resting
+        for down in [(x, y+1), (x-1, y+1), (x+1, y+1)]:
+            if not blocks[down]:
+                fall.append(down)
                 break
         else:
-            break
-        blocks.add(sand)
-        resting += 1
-    return resting
+            blocks[x, y] = True
+            fall.pop()
+            resting += 1
+    raise ValueError('blocked source')
 
 
 def part2(input):
-    blocks = set()
-    for points in parse(input):
-        blocks.update(path(points))
-    floor = max(y+1 for (x, y) in blocks)
-
+    points = rocks(input)
+    xs = [x for x, y in points]
+    floor = max(y+1 for x, y in points)
+    # the sand spreads at most one step sideways per row
+    blocks = grid.Grid.from_points(
+        points, (min(xs + [500-floor]), 0), (max(xs + [500+floor]), floor))
+
+    # sweep down the rows, tracking which cells the sand can reach
+    sand = np.zeros(blocks.shape[0], dtype=bool)
+    sand[500 - blocks.origin[0]] = True
     resting = 0
-    while True:
-        x, y = sand = (500, 0)
-        if sand in blocks:
-            break
-        while y < floor:
-            for down in [(x, y+1), (x-1, y+1), (x+1, y+1)]:
-                if down not in blocks:
-                    x, y = sand = down
-                    break
-            else:
-                break
-        blocks.add(sand)
-        resting += 1
+    for row in blocks.cells.T:
+        sand &= ~row
+        resting += int(sand.sum())
+        sand = grid.dilate(sand, [(-1,), (1,)])
     return resting
 
 
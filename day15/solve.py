@@ -8,9 +8,12 @@ Advent of Code 2022 -- Day 15
 56000011
 """
 
-import re
 import sys
 
+from aoc import instrument
+from aoc import parsing
+from aoc import snapshot
+
 TEST_INPUT = """\
 Sensor at x=2, y=18: closest beacon is at x=-2, y=15
 Sensor at x=9, y=16: closest beacon is at x=10, y=16
@@ -29,19 +32,17 @@ Sensor at x=20, y=1: closest beacon is at x=15, y=3
 """
 
 num = r'(0|-?[1-9]\d*)'
-line_re = re.compile(
+line_re = parsing.LazyPattern(
     f'Sensor at x={num}, y={num}: closest beacon is at x={num}, y={num}'
 )
 
 
+@instrument.timed('parse')
+@snapshot.cached
 def parse(input):
     sensors = []
     beacons = set()
-    for line in input.splitlines():
-        m = line_re.fullmatch(line)
-        if m is None:
-            raise ValueError(f'bad line: {line!r}')
-        sx, sy, bx, by = map(int, m.groups())
+    for sx, sy, bx, by in parsing.records(input, line_re, message='bad line'):
         sd = abs(sx-bx) + abs(sy-by)
         sensors.append((sx, sy, sd))
         beacons.add((bx, by))
@@ -8,10 +8,13 @@ Advent of Code 2022 -- Day 16
 1707
 """
 
-import re
 import sys
 from typing import NamedTuple
 
+from aoc import instrument
+from aoc import parsing
+from aoc import snapshot
+
 TEST_INPUT = """\
 Valve AA has flow rate=0; tunnels lead to valves DD, II, BB
 Valve BB has flow rate=13; tunnels lead to valves CC, AA
@@ -26,7 +29,7 @@ Valve JJ has flow rate=21; tunnel leads to valve II
 """
 
 # this regular expression is very pedantic: it checks the grammar
-line_re = re.compile(
+line_re = parsing.LazyPattern(
     r'Valve (?P<name>[A-Z]{2}) '
     r'has flow rate=(?P<rate>0|[1-9]\d*); '
     r'tunnel(?P<plural>s)? lead(?(plural)|s) to valve(?(plural)s) '
@@ -82,6 +85,8 @@ class State(NamedTuple):
         return self.released
 
 
+@instrument.timed('parse')
+@snapshot.cached
 def parse(input):
     valves = {}
     for line in input.splitlines():
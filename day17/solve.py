@@ -8,15 +8,18 @@ Advent of Code 2022 -- Day 17
 1514285714288
 """
 
-import re
 import sys
 from typing import NamedTuple
 
+from aoc import instrument
+from aoc import parsing
+from aoc import snapshot
+
 TEST_INPUT = """\
 >>><<><>><<<>><>>><<<>>><<<><<<>><>><<>>
 """
 
-input_re = re.compile(r'(?P<jets>[<>]+)\n')
+input_re = parsing.LazyPattern(r'(?P<jets>[<>]+)\n')
 
 
 class Shape(NamedTuple):
@@ -40,6 +43,7 @@ class Simulation:
         self.shape_index = 0
         self.jets = jets
         self.jet_index = 0
+        # the chamber, as (x, y) cells, with the floor at y = 0
         self.blocks = {(x, 0) for x in range(7)}
         self.left_y = 0
         self.top_y = 0
@@ -138,6 +142,8 @@ class Simulation:
         return False
 
 
+@instrument.timed('parse')
+@snapshot.cached
 def parse(input):
     m = input_re.fullmatch(input)
     if m is None:
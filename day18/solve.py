@@ -10,6 +10,12 @@ Advent of Code 2022 -- Day 18
 
 import sys
 
+import numpy as np
+
+from aoc import grid
+from aoc import instrument
+from aoc import snapshot
+
 TEST_INPUT = """\
 2,2,2
 1,2,2
@@ -27,64 +33,42 @@ TEST_INPUT = """\
 """
 
 
+@instrument.timed('parse')
+@snapshot.cached
 def parse(input):
-    return {
+    return grid.Grid.from_points(
         (int(x), int(y), int(z))
         for x, y, z in (
             line.split(',', maxsplit=2)
             for line in input.splitlines()
-        )}
-
-
-def neighbours(cube):
-    x, y, z = cube
-    return [
-        (x+1, y, z),
-        (x-1, y, z),
-        (x, y+1, z),
-        (x, y-1, z),
-        (x, y, z+1),
-        (x, y, z-1),
-    ]
+        ))
 
 
 def part1(input):
-    cubes = parse(input)
+    cubes = parse(input).pad(1).cells
     return sum(
-        neighbour not in cubes
-        for cube in cubes
-        for neighbour in neighbours(cube)
+        int((cubes & ~grid.shift(cubes, offset)).sum())
+        for offset in grid.directions(3)
     )
 
 
 def part2(input):
-    cubes = parse(input)
+    cubes = parse(input).pad(1).cells
 
-    min_corner = tuple(
-        min(c[i] for c in cubes) - 1
-        for i in range(3)
-    )
+    # let the steam in from a corner, which is outside of the droplet
+    steam = np.zeros(cubes.shape, dtype=bool)
+    steam[0, 0, 0] = True
+    while True:
+        spread = grid.dilate(steam, grid.directions(3)) & ~cubes
+        if (spread == steam).all():
+            break
+        steam = spread
 
-    max_corner = tuple(
-        max(c[i] for c in cubes) + 1
-        for i in range(3)
+    return sum(
+        int((cubes & grid.shift(steam, offset)).sum())
+        for offset in grid.directions(3)
     )
 
-    area = 0
-    steam = set()
-    stack = [min_corner]
-    while stack:
-        cube = stack.pop()
-        if all(i <= j <= k for i, j, k in zip(min_corner, cube, max_corner)):
-            if cube in cubes:
-                area += 1
-            elif cube in steam:
-                pass
-            else:
-                steam.add(cube)
-                stack.extend(neighbours(cube))
-    return area
-
 
 def main(args):
     input = open('input.txt').read()
@@ -16,10 +16,12 @@ Advent of Code 2022 -- Day 19
 from heapq import heappush, heappop, heapify
 from itertools import combinations
 from math import prod
-import re
 import sys
 from typing import NamedTuple
 
+from aoc import instrument
+from aoc import parsing
+
 TEST_INPUT = (
     "Blueprint 1: "
     "Each ore robot costs 4 ore. "
@@ -33,7 +35,7 @@ TEST_INPUT = (
     "Each geode robot costs 3 ore and 12 obsidian.\n"
 )
 
-line_re = re.compile(
+line_re = parsing.LazyPattern(
     r'Blueprint ([1-9]\d*): '
     r'Each ore robot costs ([1-9]\d*) ore. '
     r'Each clay robot costs ([1-9]\d*) ore. '
@@ -52,6 +54,7 @@ class Blueprint(NamedTuple):
     geod_obsi: int
 
     @classmethod
+    @instrument.timed('parse')
     def parse(cls, line):
         m = line_re.fullmatch(line)
         if m is None:
@@ -9,10 +9,13 @@ Advent of Code 2022 -- Day 21
 """
 
 import itertools as it
-import re
 import sys
 from typing import Iterable
 
+from aoc import instrument
+from aoc import parsing
+from aoc import snapshot
+
 TEST_INPUT = """\
 root: pppw + sjmn
 dbpl: 5
@@ -31,7 +34,7 @@ drzm: hmdt - zczc
 hmdt: 32
 """
 
-line_re = re.compile(
+line_re = parsing.LazyPattern(
     r'(?P<monkey>[a-z]{4}): '
     r'(?:(?P<number>0|-?[1-9]\d*)'
     r'|(?P<left>[a-z]{4}) (?P<op>[+\-*/]) (?P<right>[a-z]{4}))'
@@ -110,17 +113,17 @@ class Rational:
         return self / other
 
 
+@instrument.timed('parse')
+@snapshot.cached
 def parse(input):
     value = {}
     expr = {}
-    for line in input.splitlines():
-        m = line_re.fullmatch(line)
-        if m is None:
-            raise ValueError(f'bad line: {line!r}')
-        if m['number'] is not None:
-            value[m['monkey']] = int(m['number'])
+    lines = parsing.fields(input, line_re, message='bad line')
+    for monkey, number, left, op, right in lines:
+        if number:
+            value[monkey] = int(number)
         else:
-            expr[m['monkey']] = (m['left'], m['op'], m['right'])
+            expr[monkey] = (left, op, right)
     return value, expr
 
 
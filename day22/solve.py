@@ -12,6 +12,9 @@ import itertools as it
 import sys
 from typing import NamedTuple
 
+from aoc import instrument
+from aoc import snapshot
+
 TEST_INPUT = """\
         ...#
         .#..
@@ -124,6 +127,7 @@ class Board:
     tiles: list[list[Tile]]
     path: str
 
+    @instrument.timed('parse')
     def __init__(self, input, tile_size):
         lines = input.splitlines()
 
@@ -257,6 +261,13 @@ class Board:
         )
 
 
+@instrument.timed('parse')
+@snapshot.cached
+def parse(input, tile_size):
+    return Board(input, tile_size)
+
+
+@instrument.timed('parse')
 def steps(path):
     i = 0
     for j, char in enumerate(path):
@@ -272,7 +283,7 @@ def steps(path):
 
 
 def part1(input, tile_size):
-    board = Board(input, tile_size)
+    board = parse(input, tile_size)
     board.wrap_flat()
     pos = board.walk()
     # print(board)
@@ -280,7 +291,7 @@ def part1(input, tile_size):
 
 
 def part2(input, tile_size):
-    board = Board(input, tile_size)
+    board = parse(input, tile_size)
     board.wrap_cube()
     pos = board.walk()
     # print(board)
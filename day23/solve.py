@@ -8,9 +8,13 @@ Advent of Code 2022 -- Day 23
 20
 """
 
-import collections
 import sys
-from typing import NamedTuple
+
+import numpy as np
+
+from aoc import grid
+from aoc import instrument
+from aoc import snapshot
 
 TEST_INPUT = """\
 ....#..
@@ -23,91 +27,75 @@ TEST_INPUT = """\
 """
 
 
-class Point(NamedTuple):
-    row: int
-    col: int
-
-    def __add__(self, other):
-        return Point(*(a + b for a, b in zip(self, other)))
+# the directions in which the elves consider moving, each with the
+# neighbours which must be free for them to move that way
+CONDITIONS = [
+    ((-1, 0), [(-1, -1), (-1, 0), (-1, +1)]),
+    ((+1, 0), [(+1, -1), (+1, 0), (+1, +1)]),
+    ((0, -1), [(-1, -1), (0, -1), (+1, -1)]),
+    ((0, +1), [(-1, +1), (0, +1), (+1, +1)]),
+]
 
 
+@instrument.timed('parse')
+@snapshot.cached
 def parse(input):
-    elves = set()
-    for row, line in enumerate(input.splitlines()):
-        for col, char in enumerate(line):
-            if char == '.':
-                pass
-            elif char == '#':
-                elves.add(Point(row, col))
-            else:
-                raise ValueError(f'bad character: {char!r}')
-    conditions = [
-        (Point(0, 0), [
-            Point(-1, -1), Point(-1, 0), Point(-1, +1), Point(0, -1),
-            Point(0, +1), Point(+1, -1), Point(+1, 0), Point(+1, +1),
-        ]),
-        (Point(-1, 0), [
-            Point(-1, -1), Point(-1, 0), Point(-1, +1),
-        ]),
-        (Point(+1, 0), [
-            Point(+1, -1), Point(+1, 0), Point(+1, +1),
-        ]),
-        (Point(0, -1), [
-            Point(-1, -1), Point(0, -1), Point(+1, -1),
-        ]),
-        (Point(0, +1), [
-            Point(-1, +1), Point(0, +1), Point(+1, +1),
-        ]),
-        (Point(0, 0), []),
-    ]
-    return elves, conditions
+    chars = grid.Grid.parse(input)
+    return chars.translate({'.': False, '#': True})
+
+
+def opposite(offset):
+    return tuple(-d for d in offset)
 
 
 def do_round(elves, conditions):
-    proposal = {}
-    for elf in elves:
-        proposal[elf] = elf + next(
-            direction
-            for direction, blockers in conditions
-            if all(
-                elf + blocker not in elves
-                for blocker in blockers
-            )
-        )
-    count = collections.Counter(proposal.values())
-    next_elves = {
-        destination if count[destination] == 1 else source
-        for source, destination in proposal.items()
+    cells = elves.cells
+    if cells[[0, -1]].any() or cells[:, [0, -1]].any():
+        # make room for the elves to spread out
+        elves = elves.pad(1)
+        cells = elves.cells
+    # whether the neighbour at each offset of a cell is an elf
+    occupied = {
+        offset: grid.shift(cells, opposite(offset))
+        for offset in grid.directions(2, diagonal=True)
     }
-    assert len(next_elves) == len(elves)
-    next_conditions = (
-        conditions[:1]
-        + conditions[2:5]
-        + conditions[1:2]
-        + conditions[5:]
-    )
-    return next_elves, next_conditions
+    undecided = cells & np.logical_or.reduce(list(occupied.values()))
+    proposals = []
+    for direction, blockers in conditions:
+        free = ~np.logical_or.reduce([occupied[b] for b in blockers])
+        proposal = undecided & free
+        undecided &= ~proposal
+        proposals.append((direction, grid.shift(proposal, direction)))
+    # only one elf may move to each cell
+    count = sum(target.astype(np.int8) for _, target in proposals)
+    moved = False
+    next_cells = cells.copy()
+    for direction, target in proposals:
+        target &= count == 1
+        if target.any():
+            moved = True
+            next_cells |= target
+            next_cells &= ~grid.shift(target, opposite(direction))
+    next_conditions = conditions[1:] + conditions[:1]
+    return grid.Grid(next_cells, elves.origin), next_conditions, moved
 
 
 def part1(input):
-    elves, conditions = parse(input)
+    elves, conditions = parse(input), CONDITIONS
     for _ in range(10):
-        elves, conditions = do_round(elves, conditions)
-    min_row = min(r for r, c in elves)
-    min_col = min(c for r, c in elves)
-    max_row = max(r for r, c in elves)
-    max_col = max(c for r, c in elves)
-    return (max_row - min_row + 1) * (max_col - min_col + 1) - len(elves)
+        elves, conditions, _ = do_round(elves, conditions)
+    points = elves.points()
+    area = np.prod(points.max(axis=0) - points.min(axis=0) + 1)
+    return int(area) - len(points)
 
 
 def part2(input):
-    elves, conditions = parse(input)
+    elves, conditions = parse(input), CONDITIONS
     n = 1
     while True:
-        next_elves, conditions = do_round(elves, conditions)
-        if next_elves == elves:
+        elves, conditions, moved = do_round(elves, conditions)
+        if not moved:
             break
-        elves = next_elves
         n += 1
     return n
 
@@ -8,9 +8,15 @@ Advent of Code 2022 -- Day 24
 54
 """
 
-import re
 import sys
 
+import numpy as np
+
+from aoc import grid
+from aoc import instrument
+from aoc import parsing
+from aoc import snapshot
+
 TEST_INPUT = """\
 #.######
 #>>.<^<#
@@ -20,10 +26,12 @@ TEST_INPUT = """\
 ######.#
 """
 
-cliff_re = re.compile(r'#+(?P<hole>\.)#+')
-valley_re = re.compile(r'#(?P<hole>[>v<^.]+)#')
+cliff_re = parsing.LazyPattern(r'#+(?P<hole>\.)#+')
+valley_re = parsing.LazyPattern(r'#(?P<hole>[>v<^.]+)#')
 
 
+@instrument.timed('parse')
+@snapshot.cached
 def parse(input):
     lines = input.splitlines()
     if len(lines) < 3:
@@ -35,44 +43,41 @@ def parse(input):
     m = cliff_re.fullmatch(top)
     if m is None:
         raise ValueError('invalid top line')
-    start = (m.start('hole')-1, 0)
+    start = (0, m.start('hole')-1)
     m = cliff_re.fullmatch(bot)
     if m is None:
         raise ValueError('invalid bottom line')
-    goal = (m.start('hole')-1, len(mid)-1)
+    goal = (len(mid)-1, m.start('hole')-1)
 
-    board = []
+    holes = []
     for line in mid:
         m = valley_re.fullmatch(line)
         if m is None:
             raise ValueError('invalid middle line')
-        board.append(m['hole'])
+        holes.append(m['hole'])
+    board = grid.Grid.parse('\n'.join(holes))
 
     return start, goal, board
 
 
+# how each kind of blizzard moves along the (row, column) axes
+WINDS = {'>': (0, 1), 'v': (1, 0), '<': (0, -1), '^': (-1, 0)}
+
+
 def walk(time, start, goal, board):
-    height = len(board)
-    width = len(board[0])
-    current = set()
-    while goal not in current:
+    winds = [
+        (board.cells == ord(wind), offset)
+        for wind, offset in WINDS.items()
+    ]
+    steps = grid.directions(2)
+    current = np.zeros(board.shape, dtype=bool)
+    while not current[goal]:
         time += 1
-        current = {
-            (x+dx, y+dy)
-            for x, y in current
-            for dx, dy in [(-1, 0), (0, -1), (0, 0), (0, 1), (1, 0)]
-        }
-        current.add(start)
-        current = {
-            (x, y)
-            for x, y in current
-            if 0 <= x < width
-            and 0 <= y < height
-            and board[y][(x-time) % width] != '>'
-            and board[(y-time) % height][x] != 'v'
-            and board[y][(x+time) % width] != '<'
-            and board[(y+time) % height][x] != '^'
-        }
+        current = grid.dilate(current, steps)
+        current[start] = True
+        for blizzards, offset in winds:
+            # blizzards wrap around the valley
+            current &= ~np.roll(blizzards, np.multiply(offset, time), (0, 1))
     return time + 1
 
 
@@ -12,6 +12,9 @@ NotImplementedError
 
 import sys
 
+from aoc import instrument
+from aoc import parsing
+
 TEST_INPUT = """\
 1=-0-2
 12111
@@ -29,6 +32,7 @@ TEST_INPUT = """\
 """
 
 
+@instrument.timed('parse')
 def int_from_snafu(line):
     n = 0
     for char in line:
@@ -46,7 +50,7 @@ def snafu_from_int(n):
 
 def part1(input):
     return snafu_from_int(sum(
-        int_from_snafu(line) for line in input.splitlines()
+        int_from_snafu(line) for line in parsing.lines(input)
     ))
 
 
@@ -55,7 +59,7 @@ def part2(input):
 
 
 def main(args):
-    input = open('input.txt').read()
+    input = open('input.txt')
     if args == ['1']:
         print(part1(input), file=open('output1.txt', 'w'))
     elif args == ['2']: